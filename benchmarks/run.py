@@ -0,0 +1,404 @@
+"""Benchmark suite with scaling curves and regression gates
+
+Each case is timed and its peak memory traced over a sweep of ranks. The
+scaling exponent k of time ~ rank ** k is fitted by least squares on a
+log-log scale. Results are compared with a JSON baseline, and the run
+fails when a case is slower or uses more memory than the baseline by more
+than a threshold, or when its exponent grows by more than a tolerance.
+
+Cases named ``*_cold`` drop the intern table and the tower before every
+call, so they measure the arithmetic engine instead of cache hits. A
+set-theoretic number of rank n holds about n ** 2 / 2 references, so set
+cases stop at their max_rank; ``compact_*`` cases cover larger ranks.
+
+Usage::
+
+    python benchmarks/run.py --save           # record a baseline
+    python benchmarks/run.py                  # compare with the baseline
+    python benchmarks/run.py --ranks 10,100 --threshold 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+# Ensure src layout is importable when running without installation
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from pynumber import (  # noqa: E402
+    Integer,
+    Rational,
+    compact,
+    create_integer_from_int,
+    create_natural_from_int,
+)
+from pynumber import natural as natural_module  # noqa: E402
+
+DEFAULT_RANKS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_EXPONENT_TOLERANCE = 0.25
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+MIN_DURATION = 0.05
+# Peaks below this are dominated by noise and never count as regressions
+MIN_PEAK_BYTES = 4096
+# Highest rank of set-theoretic cases; the tower of rank 10,000 is ~400 MB
+SET_MAX_RANK = 10_000
+
+# A case prepares its operands for a rank and returns the call to measure
+Case = Callable[[int], Callable[[], object]]
+
+
+class Benchmark(NamedTuple):
+    """A case and the highest rank it runs at"""
+
+    prepare: Case
+    max_rank: int = SET_MAX_RANK
+    # Whether the case builds set-theoretic numbers from the tower
+    tower: bool = True
+
+
+def _drop_caches() -> None:
+    """Drop the intern table and the tower"""
+    limit = natural_module.get_tower_limit()
+    natural_module.clear_intern_table()
+    natural_module.set_tower_limit(0)
+    natural_module.set_tower_limit(limit)
+
+
+def _cold(case: Case) -> Case:
+    """Make a case drop the caches before every call"""
+
+    def prepare(rank: int) -> Callable[[], object]:
+        call = case(rank)
+
+        def run() -> object:
+            _drop_caches()
+            return call()
+
+        return run
+
+    return prepare
+
+
+def _create_natural(rank: int) -> Callable[[], object]:
+    return lambda: create_natural_from_int(rank)
+
+
+def _successor(rank: int) -> Callable[[], object]:
+    natural = create_natural_from_int(rank)
+    return lambda: natural.successor
+
+
+def _predecessor(rank: int) -> Callable[[], object]:
+    natural = create_natural_from_int(rank)
+    return lambda: natural.predecessor
+
+
+def _add(rank: int) -> Callable[[], object]:
+    a = create_natural_from_int(rank // 2)
+    b = create_natural_from_int(rank - rank // 2)
+    return lambda: a + b
+
+
+def _mul(rank: int) -> Callable[[], object]:
+    side = math.isqrt(rank)
+    a = create_natural_from_int(side)
+    b = create_natural_from_int(rank // max(side, 1))
+    return lambda: a * b
+
+
+def _compare(rank: int) -> Callable[[], object]:
+    a = create_natural_from_int(rank)
+    b = create_natural_from_int(rank - 1)
+    return lambda: (a < b, a <= b, a == b, a > b)
+
+
+def _integer_new(rank: int) -> Callable[[], object]:
+    # A non-canonical pair has to be canonicalized
+    positive = create_natural_from_int(rank)
+    negative = create_natural_from_int(rank // 2)
+    return lambda: Integer(positive, negative)
+
+
+def _rational_normalize(rank: int) -> Callable[[], object]:
+    numerator = create_integer_from_int(rank)
+    denominator = create_integer_from_int(-2 * rank)
+    return lambda: Rational(numerator, denominator)
+
+
+def _rational_add(rank: int) -> Callable[[], object]:
+    side = max(math.isqrt(rank), 2)
+    a = Rational(create_integer_from_int(1), create_integer_from_int(side))
+    b = Rational(create_integer_from_int(-1), create_integer_from_int(side - 1))
+    return lambda: a + b
+
+
+def _compact_create_natural(rank: int) -> Callable[[], object]:
+    return lambda: compact.create_natural_from_int(rank)
+
+
+def _compact_add(rank: int) -> Callable[[], object]:
+    a = compact.create_natural_from_int(rank // 2)
+    b = compact.create_natural_from_int(rank - rank // 2)
+    return lambda: a + b
+
+
+def _compact_mul(rank: int) -> Callable[[], object]:
+    side = math.isqrt(rank)
+    a = compact.create_natural_from_int(side)
+    b = compact.create_natural_from_int(rank // max(side, 1))
+    return lambda: a * b
+
+
+def _compact_integer_new(rank: int) -> Callable[[], object]:
+    positive = compact.create_natural_from_int(rank)
+    negative = compact.create_natural_from_int(rank // 2)
+    return lambda: compact.Integer(positive, negative)
+
+
+CASES: dict[str, Benchmark] = {
+    "create_natural_from_int": Benchmark(_cold(_create_natural)),
+    "natural_successor": Benchmark(_successor),
+    "natural_successor_cold": Benchmark(_cold(_successor)),
+    "natural_predecessor": Benchmark(_predecessor),
+    "natural_predecessor_cold": Benchmark(_cold(_predecessor)),
+    "natural_add": Benchmark(_add),
+    "natural_add_cold": Benchmark(_cold(_add)),
+    "natural_mul": Benchmark(_mul),
+    "natural_mul_cold": Benchmark(_cold(_mul)),
+    "natural_compare": Benchmark(_compare),
+    "integer_new": Benchmark(_integer_new),
+    "integer_new_cold": Benchmark(_cold(_integer_new)),
+    # The denominator has twice the rank
+    "rational_normalize": Benchmark(_rational_normalize, SET_MAX_RANK // 2),
+    "rational_normalize_cold": Benchmark(_cold(_rational_normalize), SET_MAX_RANK // 2),
+    "rational_add": Benchmark(_rational_add),
+    "rational_add_cold": Benchmark(_cold(_rational_add)),
+    "compact_create_natural_from_int": Benchmark(
+        _compact_create_natural, DEFAULT_RANKS[-1], tower=False
+    ),
+    "compact_natural_add": Benchmark(_compact_add, DEFAULT_RANKS[-1], tower=False),
+    "compact_natural_mul": Benchmark(_compact_mul, DEFAULT_RANKS[-1], tower=False),
+    "compact_integer_new": Benchmark(
+        _compact_integer_new, DEFAULT_RANKS[-1], tower=False
+    ),
+}
+
+
+def measure(call: Callable[[], object], repeat: int = 3) -> tuple[float, int]:
+    """Measure the best time per call and the peak memory of one call
+
+    Args:
+        call (Callable[[], object]): call to measure
+        repeat (int): number of timing rounds
+
+    Returns:
+        tuple[float, int]: seconds per call and peak bytes
+    """
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < MIN_DURATION and number < 1 << 20:
+        number *= 10
+    seconds = min(timer.repeat(repeat, number)) / number
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def fit_exponent(ranks: list[int], seconds: list[float]) -> float:
+    """Fit k of seconds ~ rank ** k by least squares on a log-log scale
+
+    Args:
+        ranks (list[int]): ranks
+        seconds (list[float]): seconds per call at each rank
+
+    Returns:
+        float: scaling exponent, or 0.0 with fewer than two ranks
+    """
+    points = [
+        (math.log(rank), math.log(second))
+        for rank, second in zip(ranks, seconds, strict=True)
+        if rank > 0 and second > 0
+    ]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance if variance else 0.0
+
+
+def run(cases: list[str], ranks: list[int]) -> dict[str, dict]:
+    """Run cases over ranks
+
+    Args:
+        cases (list[str]): names of cases
+        ranks (list[int]): ranks to sweep; ranks above the max_rank of a
+            case are skipped for that case
+
+    Returns:
+        dict[str, dict]: seconds, peak bytes and exponent per case
+    """
+    results = {}
+    for name in cases:
+        benchmark = CASES[name]
+        case_ranks = [rank for rank in ranks if rank <= benchmark.max_rank]
+        if len(case_ranks) < len(ranks):
+            print(f"{name:<32} skipping ranks above {benchmark.max_rank}")
+        seconds, peaks = [], []
+        for rank in case_ranks:
+            second, peak = measure(benchmark.prepare(rank))
+            seconds.append(second)
+            peaks.append(peak)
+            print(f"{name:<32} rank={rank:<8} {second * 1e6:12.2f} us {peak:>12} B")
+        results[name] = {
+            "ranks": case_ranks,
+            "seconds": seconds,
+            "peak_bytes": peaks,
+            "exponent": fit_exponent(case_ranks, seconds),
+        }
+    return results
+
+
+def regressions(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float,
+    exponent_tolerance: float = DEFAULT_EXPONENT_TOLERANCE,
+) -> list[str]:
+    """Find cases that regressed against the baseline
+
+    A case regresses when it is slower or its peak memory is larger than
+    the baseline by more than threshold at a rank, or when its scaling
+    exponent grows by more than exponent_tolerance.
+
+    Args:
+        results (dict[str, dict]): current results
+        baseline (dict[str, dict]): baseline results
+        threshold (float): allowed relative slowdown and memory growth,
+            e.g. 0.25 for 25%
+        exponent_tolerance (float): allowed absolute growth of the exponent
+
+    Returns:
+        list[str]: descriptions of regressions
+    """
+    found = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        base_seconds = dict(zip(base["ranks"], base["seconds"], strict=True))
+        base_peaks = dict(zip(base["ranks"], base["peak_bytes"], strict=True))
+        for rank, second, peak in zip(
+            result["ranks"], result["seconds"], result["peak_bytes"], strict=True
+        ):
+            if rank in base_seconds and second > base_seconds[rank] * (1 + threshold):
+                found.append(
+                    f"{name} rank={rank}: {second * 1e6:.2f} us "
+                    f"vs baseline {base_seconds[rank] * 1e6:.2f} us"
+                )
+            if (
+                rank in base_peaks
+                and peak > MIN_PEAK_BYTES
+                and peak > base_peaks[rank] * (1 + threshold)
+            ):
+                found.append(
+                    f"{name} rank={rank}: {peak} B vs baseline {base_peaks[rank]} B"
+                )
+        if result["exponent"] > base["exponent"] + exponent_tolerance:
+            found.append(
+                f"{name}: exponent {result['exponent']:.2f} "
+                f"vs baseline {base['exponent']:.2f}"
+            )
+    return found
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument(
+        "--ranks",
+        default=",".join(map(str, DEFAULT_RANKS)),
+        help="comma-separated ranks to sweep",
+    )
+    parser.add_argument(
+        "--cases", default=",".join(CASES), help="comma-separated cases to run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.environ.get("PYNUMBER_BENCH_THRESHOLD", DEFAULT_THRESHOLD)),
+        help="allowed relative slowdown and memory growth against the baseline",
+    )
+    parser.add_argument(
+        "--exponent-tolerance",
+        type=float,
+        default=DEFAULT_EXPONENT_TOLERANCE,
+        help="allowed absolute growth of scaling exponents against the baseline",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="record results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    ranks = [int(rank) for rank in args.ranks.split(",")]
+    cases = args.cases.split(",")
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    # The tower has to hold the operands of every set-theoretic case
+    tower_ranks = [
+        min(rank, CASES[name].max_rank)
+        for name in cases
+        if CASES[name].tower
+        for rank in ranks
+    ]
+    natural_module.set_tower_limit(
+        max(natural_module.get_tower_limit(), *tower_ranks, 0)
+    )
+
+    results = run(cases, ranks)
+    for name, result in results.items():
+        print(f"{name:<32} exponent={result['exponent']:.2f}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"saved baseline to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        # Timings are machine specific, so each machine records its baseline
+        print(
+            f"ERROR no baseline at {args.baseline}, "
+            "run with --save to record one on this machine",
+            file=sys.stderr,
+        )
+        return 2
+    found = regressions(
+        results,
+        json.loads(args.baseline.read_text()),
+        args.threshold,
+        args.exponent_tolerance,
+    )
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
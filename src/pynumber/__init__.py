@@ -2,11 +2,15 @@
 
 # Explicit re-exports for public API (sorted)
 from pynumber._version import __version__ as __version__
-from pynumber.integer import Integer as Integer
-from pynumber.integer import create_integer_from_int as create_integer_from_int
-from pynumber.natural import Natural as Natural
-from pynumber.natural import create_natural_from_int as create_natural_from_int
+from pynumber.backend import Integer as Integer
+from pynumber.backend import Natural as Natural
+from pynumber.backend import create_integer_from_int as create_integer_from_int
+from pynumber.backend import create_natural_from_int as create_natural_from_int
+from pynumber.backend import gcd as gcd
+from pynumber.backend import lcm as lcm
+from pynumber.profiling import profile as profile
 from pynumber.rational import Rational as Rational
+from pynumber.rational import create_rational_from_ints as create_rational_from_ints
 
 __all__ = [
     "__version__",
@@ -14,5 +18,9 @@ __all__ = [
     "create_natural_from_int",
     "Integer",
     "create_integer_from_int",
+    "gcd",
+    "lcm",
     "Rational",
+    "create_rational_from_ints",
+    "profile",
 ]
@@ -0,0 +1,474 @@
+"""Arrays of numbers stored as machine integers
+
+NaturalArray and IntegerArray store ranks and values in an ``array("q")``
+buffer, and RationalArray stores reduced numerators and denominators in two
+such buffers. Elementwise operations, comparisons and reductions run on the
+buffers, and a set-theoretic number is built only when an element is
+indexed or iterated. Values must fit in a signed 64-bit integer.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from fractions import Fraction
+from itertools import repeat
+from typing import TypeVar, overload
+
+from pynumber.backend import (
+    Integer,
+    Natural,
+    create_integer_from_int,
+    create_natural_from_int,
+)
+from pynumber.rational import Rational
+
+TArray = TypeVar("TArray", bound="_ValueArray")
+
+
+class _ValueArray(ABC):
+    """Array of numbers that are identified by one machine integer"""
+
+    __slots__ = ("_values",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self: _ValueArray, numbers: Iterable[object] = ()) -> None:
+        self._values = array("q", (self._to_value(number) for number in numbers))
+
+    @classmethod
+    def from_ints(cls: type[TArray], values: Iterable[int]) -> TArray:
+        """Create an array from machine integers
+
+        Args:
+            cls (type): cls
+            values (Iterable[int]): values of elements
+
+        Raises:
+            ValueError: a value is out of the range of the element type
+
+        Returns:
+            array of numbers
+        """
+        result = cls()
+        result._values = array("q", values)
+        result._check(result._values)
+        return result
+
+    def to_ints(self: _ValueArray) -> list[int]:
+        """Get the values of elements as machine integers
+
+        Returns:
+            list[int]: values of elements
+        """
+        return self._values.tolist()
+
+    @abstractmethod
+    def _to_value(self: _ValueArray, number: object) -> int:
+        """Get the machine integer of an element"""
+
+    @abstractmethod
+    def _to_number(self: _ValueArray, value: int) -> object:
+        """Build the element of a machine integer"""
+
+    def _check(self: _ValueArray, values: Iterable[int]) -> None:
+        """Validate values; every machine integer is valid by default"""
+        return None
+
+    def _from_values(self: TArray, values: Iterable[int]) -> TArray:
+        result = type(self)()
+        result._values = array("q", values)
+        self._check(result._values)
+        return result
+
+    def _operands(self: _ValueArray, other: object) -> Iterable[tuple[int, int]]:
+        """Pair up elements with another array or a broadcast scalar"""
+        if isinstance(other, type(self)):
+            if len(other) != len(self):
+                raise ValueError(f"length {len(other)} does not match {len(self)}")
+            return zip(self._values, other._values, strict=True)
+        return zip(self._values, repeat(self._to_value(other)), strict=False)
+
+    def _map(
+        self: TArray, other: object, operation: Callable[[int, int], int]
+    ) -> TArray:
+        return self._from_values(operation(a, b) for a, b in self._operands(other))
+
+    def _divmod_values(self: _ValueArray, other: object) -> list[tuple[int, int]]:
+        pairs = list(self._operands(other))
+        if any(b == 0 for _, b in pairs):
+            raise ZeroDivisionError("division by zero")
+        return [divmod(a, b) for a, b in pairs]
+
+    def __len__(self: _ValueArray) -> int:
+        return len(self._values)
+
+    def __iter__(self: _ValueArray) -> Iterator:
+        return (self._to_number(value) for value in self._values)
+
+    @overload
+    def __getitem__(self: _ValueArray, index: int) -> object: ...
+
+    @overload
+    def __getitem__(self: TArray, index: slice) -> TArray: ...
+
+    def __getitem__(self: _ValueArray, index: int | slice) -> object:
+        if isinstance(index, slice):
+            return self._from_values(self._values[index])
+        return self._to_number(self._values[index])
+
+    def __repr__(self: _ValueArray) -> str:
+        return f"{type(self).__name__}.from_ints({self._values.tolist()})"
+
+    def __eq__(  # type: ignore[override]
+        self: _ValueArray, other: object
+    ) -> list[bool]:
+        return [a == b for a, b in self._operands(other)]
+
+    def __ne__(  # type: ignore[override]
+        self: _ValueArray, other: object
+    ) -> list[bool]:
+        return [a != b for a, b in self._operands(other)]
+
+    def __lt__(self: _ValueArray, other: object) -> list[bool]:
+        return [a < b for a, b in self._operands(other)]
+
+    def __gt__(self: _ValueArray, other: object) -> list[bool]:
+        return [a > b for a, b in self._operands(other)]
+
+    def __le__(self: _ValueArray, other: object) -> list[bool]:
+        return [a <= b for a, b in self._operands(other)]
+
+    def __ge__(self: _ValueArray, other: object) -> list[bool]:
+        return [a >= b for a, b in self._operands(other)]
+
+    def __add__(self: TArray, other: object) -> TArray:
+        return self._map(other, int.__add__)
+
+    def __mul__(self: TArray, other: object) -> TArray:
+        return self._map(other, int.__mul__)
+
+    def __floordiv__(self: TArray, other: object) -> TArray:
+        return self._from_values(q for q, _ in self._divmod_values(other))
+
+    def __mod__(self: TArray, other: object) -> TArray:
+        return self._from_values(r for _, r in self._divmod_values(other))
+
+    def sum(self: _ValueArray) -> object:
+        """Sum of elements, zero if empty"""
+        return self._to_number(sum(self._values))
+
+    def prod(self: _ValueArray) -> object:
+        """Product of elements, one if empty"""
+        return self._to_number(math.prod(self._values))
+
+    def min(self: _ValueArray) -> object:
+        """Smallest element
+
+        Raises:
+            ValueError: array is empty
+        """
+        return self._to_number(min(self._values))
+
+    def max(self: _ValueArray) -> object:
+        """Largest element
+
+        Raises:
+            ValueError: array is empty
+        """
+        return self._to_number(max(self._values))
+
+
+class NaturalArray(_ValueArray):
+    """Array of natural numbers stored as ranks"""
+
+    __slots__ = ()
+
+    def _to_value(self: NaturalArray, number: object) -> int:
+        if not isinstance(number, Natural):
+            raise TypeError(f"{number} is not 'Natural'")
+        return int(number)
+
+    def _to_number(self: NaturalArray, value: int) -> Natural:
+        return create_natural_from_int(value)
+
+    def _check(self: NaturalArray, values: Iterable[int]) -> None:
+        if any(value < 0 for value in values):
+            raise ValueError("Natural ranks must be non-negative integers.")
+
+    def to_list(self: NaturalArray) -> list[Natural]:
+        """Build the elements
+
+        Returns:
+            list[Natural]: elements
+        """
+        return list(self)
+
+
+class IntegerArray(_ValueArray):
+    """Array of integers stored as values"""
+
+    __slots__ = ()
+
+    def _to_value(self: IntegerArray, number: object) -> int:
+        if not isinstance(number, Integer):
+            raise TypeError(f"{number} is not 'Integer'")
+        return int(number)
+
+    def _to_number(self: IntegerArray, value: int) -> Integer:
+        return create_integer_from_int(value)
+
+    def to_list(self: IntegerArray) -> list[Integer]:
+        """Build the elements
+
+        Returns:
+            list[Integer]: elements
+        """
+        return list(self)
+
+    def __sub__(self: IntegerArray, other: object) -> IntegerArray:
+        return self._map(other, int.__sub__)
+
+    def __neg__(self: IntegerArray) -> IntegerArray:
+        return self._from_values(-value for value in self._values)
+
+    def __abs__(self: IntegerArray) -> IntegerArray:
+        return self._from_values(abs(value) for value in self._values)
+
+
+class RationalArray:
+    """Array of rational numbers
+
+    Numerators and denominators are reduced with a vectorized gcd after
+    every operation, and denominators are positive.
+    """
+
+    __slots__ = ("_numerators", "_denominators")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self: RationalArray, rationals: Iterable[Rational] = ()) -> None:
+        pairs = []
+        for rational in rationals:
+            if not isinstance(rational, Rational):
+                raise TypeError(f"{rational} is not 'Rational'")
+            normal = rational.normalize()
+            pairs.append((int(normal.numerator), int(normal.denominator)))
+        self._numerators = array("q", (n for n, _ in pairs))
+        self._denominators = array("q", (d for _, d in pairs))
+
+    @classmethod
+    def from_ints(
+        cls: type[RationalArray],
+        numerators: Iterable[int],
+        denominators: Iterable[int] | None = None,
+    ) -> RationalArray:
+        """Create an array from machine integers
+
+        Args:
+            cls (type[RationalArray]): cls
+            numerators (Iterable[int]): numerators
+            denominators (Iterable[int] | None): denominators (default to 1)
+
+        Raises:
+            ValueError: lengths of numerators and denominators differ
+            ZeroDivisionError: a denominator is zero
+
+        Returns:
+            RationalArray: array of reduced rational numbers
+        """
+        numerators = list(numerators)
+        if denominators is None:
+            denominators = [1] * len(numerators)
+        denominators = list(denominators)
+        if len(numerators) != len(denominators):
+            raise ValueError("numerators and denominators differ in length")
+        return _normalized(numerators, denominators)
+
+    def to_ints(self: RationalArray) -> list[tuple[int, int]]:
+        """Get reduced numerators and denominators as machine integers
+
+        Returns:
+            list[tuple[int, int]]: pairs of numerator and denominator
+        """
+        return list(zip(self._numerators, self._denominators, strict=True))
+
+    def to_list(self: RationalArray) -> list[Rational]:
+        """Build the elements
+
+        Returns:
+            list[Rational]: elements
+        """
+        return list(self)
+
+    def _operands(
+        self: RationalArray, other: object
+    ) -> Iterable[tuple[int, int, int, int]]:
+        """Pair up elements with another array or a broadcast scalar"""
+        if isinstance(other, RationalArray):
+            if len(other) != len(self):
+                raise ValueError(f"length {len(other)} does not match {len(self)}")
+            return zip(
+                self._numerators,
+                self._denominators,
+                other._numerators,
+                other._denominators,
+                strict=True,
+            )
+        if not isinstance(other, Rational):
+            raise TypeError(f"{other} is not 'Rational'")
+        normal = other.normalize()
+        return zip(
+            self._numerators,
+            self._denominators,
+            repeat(int(normal.numerator)),
+            repeat(int(normal.denominator)),
+            strict=False,
+        )
+
+    def __len__(self: RationalArray) -> int:
+        return len(self._numerators)
+
+    def __iter__(self: RationalArray) -> Iterator[Rational]:
+        return (
+            _rational(n, d)
+            for n, d in zip(self._numerators, self._denominators, strict=True)
+        )
+
+    @overload
+    def __getitem__(self: RationalArray, index: int) -> Rational: ...
+
+    @overload
+    def __getitem__(self: RationalArray, index: slice) -> RationalArray: ...
+
+    def __getitem__(self: RationalArray, index: int | slice) -> object:
+        if isinstance(index, slice):
+            result = RationalArray()
+            result._numerators = self._numerators[index]
+            result._denominators = self._denominators[index]
+            return result
+        return _rational(self._numerators[index], self._denominators[index])
+
+    def __repr__(self: RationalArray) -> str:
+        return (
+            f"RationalArray.from_ints({self._numerators.tolist()}, "
+            f"{self._denominators.tolist()})"
+        )
+
+    # Denominators are positive, so fractions compare by cross-multiplication
+    def __eq__(  # type: ignore[override]
+        self: RationalArray, other: object
+    ) -> list[bool]:
+        return [a == c and b == d for a, b, c, d in self._operands(other)]
+
+    def __ne__(  # type: ignore[override]
+        self: RationalArray, other: object
+    ) -> list[bool]:
+        return [a != c or b != d for a, b, c, d in self._operands(other)]
+
+    def __lt__(self: RationalArray, other: object) -> list[bool]:
+        return [a * d < b * c for a, b, c, d in self._operands(other)]
+
+    def __gt__(self: RationalArray, other: object) -> list[bool]:
+        return [a * d > b * c for a, b, c, d in self._operands(other)]
+
+    def __le__(self: RationalArray, other: object) -> list[bool]:
+        return [a * d <= b * c for a, b, c, d in self._operands(other)]
+
+    def __ge__(self: RationalArray, other: object) -> list[bool]:
+        return [a * d >= b * c for a, b, c, d in self._operands(other)]
+
+    def __add__(self: RationalArray, other: object) -> RationalArray:
+        # (a / b) + (c / d) = (a * d + b * c) / (b * d)
+        quads = list(self._operands(other))
+        return _normalized(
+            [a * d + b * c for a, b, c, d in quads], [b * d for _, b, _, d in quads]
+        )
+
+    def __sub__(self: RationalArray, other: object) -> RationalArray:
+        # (a / b) - (c / d) = (a * d - b * c) / (b * d)
+        quads = list(self._operands(other))
+        return _normalized(
+            [a * d - b * c for a, b, c, d in quads], [b * d for _, b, _, d in quads]
+        )
+
+    def __mul__(self: RationalArray, other: object) -> RationalArray:
+        # (a / b) * (c / d) = (a * c) / (b * d)
+        quads = list(self._operands(other))
+        return _normalized(
+            [a * c for a, _, c, _ in quads], [b * d for _, b, _, d in quads]
+        )
+
+    def __truediv__(self: RationalArray, other: object) -> RationalArray:
+        # (a / b) / (c / d) = (a * d) / (b * c)
+        quads = list(self._operands(other))
+        return _normalized(
+            [a * d for a, _, _, d in quads], [b * c for _, b, c, _ in quads]
+        )
+
+    def __neg__(self: RationalArray) -> RationalArray:
+        result = RationalArray()
+        result._numerators = array("q", (-n for n in self._numerators))
+        result._denominators = array("q", self._denominators)
+        return result
+
+    def sum(self: RationalArray) -> Rational:
+        """Sum of elements over the least common denominator, zero if empty"""
+        denominator = math.lcm(*self._denominators) if len(self) else 1
+        numerator = sum(
+            n * (denominator // d)
+            for n, d in zip(self._numerators, self._denominators, strict=True)
+        )
+        return _rational(*_reduce(numerator, denominator))
+
+    def prod(self: RationalArray) -> Rational:
+        """Product of elements, one if empty"""
+        return _rational(
+            *_reduce(math.prod(self._numerators), math.prod(self._denominators))
+        )
+
+    def min(self: RationalArray) -> Rational:
+        """Smallest element
+
+        Raises:
+            ValueError: array is empty
+        """
+        return _rational(*min(self.to_ints(), key=_fraction_key))
+
+    def max(self: RationalArray) -> Rational:
+        """Largest element
+
+        Raises:
+            ValueError: array is empty
+        """
+        return _rational(*max(self.to_ints(), key=_fraction_key))
+
+
+def _reduce(numerator: int, denominator: int) -> tuple[int, int]:
+    """Reduce a fraction and make its denominator positive"""
+    if denominator == 0:
+        raise ZeroDivisionError("division by zero")
+    divisor = math.gcd(numerator, denominator)
+    if denominator < 0:
+        divisor = -divisor
+    return numerator // divisor, denominator // divisor
+
+
+def _normalized(numerators: list[int], denominators: list[int]) -> RationalArray:
+    """Build a RationalArray of reduced fractions"""
+    pairs = [_reduce(n, d) for n, d in zip(numerators, denominators, strict=True)]
+    result = RationalArray()
+    result._numerators = array("q", (n for n, _ in pairs))
+    result._denominators = array("q", (d for _, d in pairs))
+    return result
+
+
+def _rational(numerator: int, denominator: int) -> Rational:
+    return Rational(
+        create_integer_from_int(numerator), create_integer_from_int(denominator)
+    )
+
+
+def _fraction_key(pair: tuple[int, int]) -> Fraction:
+    """Sort key of a reduced numerator and denominator"""
+    return Fraction(*pair)
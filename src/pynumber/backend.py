@@ -0,0 +1,42 @@
+"""Selection of the backend of Natural and Integer
+
+The package exports the set-theoretic backend (pynumber.natural and
+pynumber.integer) by default. Setting the environment variable
+``PYNUMBER_BACKEND=compact`` before the first import of pynumber exports
+the rank-backed backend of pynumber.compact instead, for Rational as well.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+BACKENDS = ("set", "compact")
+
+_backend = os.environ.get("PYNUMBER_BACKEND", "set")
+if _backend not in BACKENDS:
+    raise ValueError(f"PYNUMBER_BACKEND must be one of {BACKENDS}, not {_backend!r}")
+
+if TYPE_CHECKING or _backend == "set":
+    from pynumber.integer import Integer as Integer
+    from pynumber.integer import create_integer_from_int as create_integer_from_int
+    from pynumber.integer import gcd as gcd
+    from pynumber.integer import lcm as lcm
+    from pynumber.natural import Natural as Natural
+    from pynumber.natural import create_natural_from_int as create_natural_from_int
+else:
+    from pynumber.compact import Integer as Integer
+    from pynumber.compact import Natural as Natural
+    from pynumber.compact import create_integer_from_int as create_integer_from_int
+    from pynumber.compact import create_natural_from_int as create_natural_from_int
+    from pynumber.compact import gcd as gcd
+    from pynumber.compact import lcm as lcm
+
+
+def get_backend() -> str:
+    """Get the backend exported by the package
+
+    Returns:
+        str: "set" or "compact"
+    """
+    return _backend
@@ -0,0 +1,479 @@
+"""Rank-backed compact construction of natural numbers and integers
+
+Natural and Integer in this module have the same public API as
+pynumber.natural.Natural and pynumber.integer.Integer, but store only a
+rank or a value. The set-theoretic tuples are built only when a number is
+indexed, iterated or unpacked, and share the tower of pynumber.natural.
+
+A module selects this backend by importing from here instead of from
+pynumber, e.g. ``from pynumber.compact import Natural, Integer``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TypeVar, overload
+
+from pynumber import integer as set_integer
+from pynumber import natural as set_natural
+from pynumber.natural import _members, _power, get_tower_limit
+
+TNaturalOrInteger = TypeVar("TNaturalOrInteger", "Natural", "Integer")
+
+
+class Natural:
+    """Natural number
+
+    Natural number includes zero. Only the rank is stored; members are
+    built from the shared tower on demand.
+    """
+
+    __slots__ = ("_rank",)
+
+    _rank: int
+
+    def __new__(cls: type[Natural], iterable: Iterable[tuple] = ()) -> Natural:
+        """new
+
+        Args:
+            cls (type[Natural]): cls
+            iterable (Iterable[tuple]): members of natural number
+
+        Returns:
+            Natural: natural number
+        """
+        if isinstance(iterable, tuple | Natural):
+            return _natural(len(iterable))
+        return _natural(sum(1 for _ in iterable))
+
+    @property
+    def successor(self: Natural) -> Natural:
+        """Get a successor number
+
+        Args:
+            self (Natural): Natural instance
+
+        Returns:
+            Natural: successor
+        """
+        return _natural(self._rank + 1)
+
+    @property
+    def predecessor(self: Natural) -> Natural:
+        """Get a predecessor number
+
+        Args:
+            self (Natural): Natural Instance
+
+        Raises:
+            ValueError: self is zero
+
+        Returns:
+            Natural: predecessor
+        """
+        if self._rank == 0:
+            raise ValueError(f"{self} does not have a predecessor")
+        return _natural(self._rank - 1)
+
+    def materialize(self: Natural) -> set_natural.Natural:
+        """Build the set-theoretic natural number
+
+        Args:
+            self (Natural): Natural instance
+
+        Returns:
+            pynumber.natural.Natural: set-theoretic natural number
+        """
+        return set_natural.create_natural_from_int(self._rank)
+
+    def __len__(self: Natural) -> int:
+        return self._rank
+
+    def __iter__(self: Natural) -> Iterator[tuple]:
+        limit = get_tower_limit()
+        members: tuple = ()
+        for rank in range(self._rank):
+            # Above the tower limit, extend the previous member locally
+            members = _members(rank) if rank <= limit else (*members, members)
+            yield members
+
+    @overload
+    def __getitem__(self: Natural, index: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self: Natural, index: slice) -> tuple[tuple, ...]: ...
+
+    def __getitem__(self: Natural, index: int | slice) -> tuple:
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        rank = index + self._rank if index < 0 else index
+        if not 0 <= rank < self._rank:
+            raise IndexError("Natural index out of range")
+        return _members(rank)
+
+    def __contains__(self: Natural, item: object) -> bool:
+        # Every member of a von Neumann natural is a smaller natural
+        if not isinstance(item, tuple) or len(item) >= self._rank:
+            return False
+        members = _members(len(item))
+        return item is members or item == members
+
+    def __eq__(self: Natural, other: object) -> bool:
+        return isinstance(other, Natural) and self._rank == other._rank
+
+    def __hash__(self: Natural) -> int:
+        return hash(self._rank)
+
+    def __ne__(self: Natural, other: object) -> bool:
+        return not self == other
+
+    def __lt__(self: Natural, other: object) -> bool:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return self._rank < other._rank
+
+    def __gt__(self: Natural, other: object) -> bool:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return self._rank > other._rank
+
+    def __ge__(self: Natural, other: object) -> bool:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return self._rank >= other._rank
+
+    def __le__(self: Natural, other: object) -> bool:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return self._rank <= other._rank
+
+    def __add__(self: Natural, other: object) -> Natural:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return _natural(self._rank + other._rank)
+
+    def __mul__(self: Natural, other: object) -> Natural:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return _natural(self._rank * other._rank)
+
+    def __floordiv__(self: Natural, other: object) -> Natural:
+        return divmod(self, other)[0]
+
+    def __mod__(self: Natural, other: object) -> Natural:
+        return divmod(self, other)[1]
+
+    def __divmod__(self: Natural, other: object) -> tuple[Natural, Natural]:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        if other._rank == 0:
+            raise ZeroDivisionError("division by zero")
+        quotient, remainder = divmod(self._rank, other._rank)
+        return _natural(quotient), _natural(remainder)
+
+    def __pow__(self: Natural, other: object, modulo: object = None) -> Natural:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        if modulo is None:
+            return _power(self, other._rank, _natural(1))
+        if not isinstance(modulo, Natural):
+            raise TypeError(f"{modulo} is not 'Natural'")
+        if modulo._rank == 0:
+            raise ValueError("pow() 3rd argument cannot be 0")
+        return _power(self, other._rank, _natural(1), lambda x: x % modulo)
+
+    def __pos__(self: Natural) -> Natural:
+        return self
+
+    def __int__(self: Natural) -> int:
+        return self._rank
+
+    def __bool__(self: Natural) -> bool:
+        return self._rank != 0
+
+    def __reduce__(self: Natural) -> tuple:
+        return create_natural_from_int, (self._rank,)
+
+    def __repr__(self: Natural) -> str:
+        return f"pynumber.compact.create_natural_from_int({self._rank})"
+
+    def __str__(self: Natural) -> str:
+        return f"Natural: {self._rank}"
+
+
+class Integer:
+    """Integer
+
+    Integer is an equivalence class of Natural pairs. Only the value of the
+    class is stored; the canonical pair is built on demand.
+    """
+
+    __slots__ = ("_value",)
+
+    _value: int
+
+    def __new__(
+        cls: type[Integer],
+        positive: Natural | None = None,
+        negative: Natural | None = None,
+    ) -> Integer:
+        """new
+
+        Args:
+            cls (type[Integer]): cls
+            positive (Natural): positive part of integer
+            negative (Natural): negative part of integer
+
+        Returns:
+            Integer: integer
+        """
+        pos = int(positive) if positive is not None else 0
+        neg = int(negative) if negative is not None else 0
+        return _integer(pos - neg)
+
+    @property
+    def positive(self: Integer) -> Natural:
+        """positive part of the canonical pair"""
+        return _natural(max(self._value, 0))
+
+    @property
+    def negative(self: Integer) -> Natural:
+        """negative part of the canonical pair"""
+        return _natural(max(-self._value, 0))
+
+    @property
+    def successor(self: Integer) -> Integer:
+        """Get a successor number
+
+        Args:
+            self (Integer): Integer instance
+
+        Returns:
+            Integer: successor
+        """
+        return _integer(self._value + 1)
+
+    @property
+    def predecessor(self: Integer) -> Integer:
+        """Get a predecessor number
+
+        Args:
+            self (Integer): Integer instance
+
+        Returns:
+            Integer: predecessor
+        """
+        return _integer(self._value - 1)
+
+    @property
+    def sign(self: Integer) -> Integer:
+        """sign of integer
+
+        Args:
+            self (Integer): Integer instance
+
+        Returns:
+            Integer: +1, -1, or 0
+        """
+        return _integer((self._value > 0) - (self._value < 0))
+
+    def materialize(self: Integer) -> set_integer.Integer:
+        """Build the set-theoretic integer
+
+        Args:
+            self (Integer): Integer instance
+
+        Returns:
+            pynumber.integer.Integer: set-theoretic integer
+        """
+        return set_integer.create_integer_from_int(self._value)
+
+    def __len__(self: Integer) -> int:
+        return 2
+
+    def __iter__(self: Integer) -> Iterator[Natural]:
+        yield self.positive
+        yield self.negative
+
+    def __getitem__(self: Integer, index: int) -> Natural:
+        return (self.positive, self.negative)[index]
+
+    def __eq__(self: Integer, other: object) -> bool:
+        return isinstance(other, Integer) and self._value == other._value
+
+    def __hash__(self: Integer) -> int:
+        return hash(self._value)
+
+    def __ne__(self: Integer, other: object) -> bool:
+        return not self == other
+
+    def __lt__(self: Integer, other: object) -> bool:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return self._value < other._value
+
+    def __gt__(self: Integer, other: object) -> bool:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return self._value > other._value
+
+    def __ge__(self: Integer, other: object) -> bool:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return self._value >= other._value
+
+    def __le__(self: Integer, other: object) -> bool:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return self._value <= other._value
+
+    def __add__(self: Integer, other: object) -> Integer:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return _integer(self._value + other._value)
+
+    def __sub__(self: Integer, other: object) -> Integer:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return _integer(self._value - other._value)
+
+    def __mul__(self: Integer, other: object) -> Integer:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        return _integer(self._value * other._value)
+
+    def __floordiv__(self: Integer, other: object) -> Integer:
+        return divmod(self, other)[0]
+
+    def __mod__(self: Integer, other: object) -> Integer:
+        return divmod(self, other)[1]
+
+    def __divmod__(self: Integer, other: object) -> tuple[Integer, Integer]:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        if other._value == 0:
+            raise ZeroDivisionError("division by zero")
+        quotient, remainder = divmod(self._value, other._value)
+        return _integer(quotient), _integer(remainder)
+
+    def __pow__(self: Integer, other: object, modulo: object = None) -> Integer:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        if other._value < 0:
+            raise ValueError("Exponent must be a non-negative integer.")
+        if modulo is None:
+            return _power(self, other._value, _integer(1))
+        if not isinstance(modulo, Integer):
+            raise TypeError(f"{modulo} is not 'Integer'")
+        if modulo._value == 0:
+            raise ValueError("pow() 3rd argument cannot be 0")
+        return _power(self, other._value, _integer(1), lambda x: x % modulo)
+
+    def __pos__(self: Integer) -> Integer:
+        return self
+
+    def __neg__(self: Integer) -> Integer:
+        return _integer(-self._value)
+
+    def __abs__(self: Integer) -> Integer:
+        return _integer(abs(self._value))
+
+    def __int__(self: Integer) -> int:
+        return self._value
+
+    def __reduce__(self: Integer) -> tuple:
+        return create_integer_from_int, (self._value,)
+
+    def __repr__(self: Integer) -> str:
+        return f"pynumber.compact.create_integer_from_int({self._value})"
+
+
+def create_natural_from_int(integer: int) -> Natural:
+    """Create Natural from integer
+
+    Args:
+        integer (int): integer
+
+    Raises:
+        ValueError: integer is negative
+
+    Returns:
+        Natural: Natural instance that represents an argument integer
+    """
+    if integer < 0:
+        raise ValueError("Arg must be a non-negative integer.")
+    return _natural(integer)
+
+
+def create_integer_from_int(integer: int) -> Integer:
+    """Create Integer from integer
+
+    Args:
+        integer (int): integer
+
+    Returns:
+        Integer: Integer instance that represents an argument integer
+    """
+    return _integer(integer)
+
+
+def gcd(a: TNaturalOrInteger, b: TNaturalOrInteger) -> TNaturalOrInteger:
+    """Greatest common divisor
+
+    Args:
+        a (Natural | Integer): number
+        b (Natural | Integer): number of the same type as a
+
+    Raises:
+        TypeError: a and b are not both Natural or both Integer
+
+    Returns:
+        Natural | Integer: non-negative greatest common divisor
+    """
+    if isinstance(a, Natural) and isinstance(b, Natural):
+        return _natural(_gcd(a._rank, b._rank))  # type: ignore[return-value]
+    if isinstance(a, Integer) and isinstance(b, Integer):
+        return _integer(_gcd(a._value, b._value))  # type: ignore[return-value]
+    raise TypeError(f"{a} and {b} are not both 'Natural' or 'Integer'")
+
+
+def lcm(a: TNaturalOrInteger, b: TNaturalOrInteger) -> TNaturalOrInteger:
+    """Least common multiple
+
+    Args:
+        a (Natural | Integer): number
+        b (Natural | Integer): number of the same type as a
+
+    Raises:
+        TypeError: a and b are not both Natural or both Integer
+
+    Returns:
+        Natural | Integer: non-negative least common multiple
+    """
+    divisor = int(gcd(a, b))
+    multiple = abs(int(a) * int(b)) // divisor if divisor else 0
+    if isinstance(a, Natural):
+        return _natural(multiple)  # type: ignore[return-value]
+    return _integer(multiple)  # type: ignore[return-value]
+
+
+def _gcd(a: int, b: int) -> int:
+    """Euclid's algorithm on plain values"""
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def _natural(rank: int) -> Natural:
+    """Build a compact natural number of rank without validation"""
+    natural = object.__new__(Natural)
+    natural._rank = rank
+    return natural
+
+
+def _integer(value: int) -> Integer:
+    """Build a compact integer of value"""
+    integer = object.__new__(Integer)
+    integer._value = value
+    return integer
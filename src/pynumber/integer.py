@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import NamedTuple, TypeVar
+from typing import NamedTuple, TypeVar, cast
 
-from pynumber.natural import Natural, create_natural_from_int
+from pynumber.natural import Natural, _power, create_natural_from_int
 
 TInteger = TypeVar("TInteger", bound="Integer")
+TNaturalOrInteger = TypeVar("TNaturalOrInteger", Natural, "Integer")
+
+DEFAULT_SMALL_INTEGER_RANGE = (-5, 256)
 
 
 class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural)])):
@@ -32,6 +35,9 @@ class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural
 
             return super().__new__(cls, positive, negative)
 
+        Pairs that are already canonical are reused as they are, and small
+        integers are taken from a preallocated pool.
+
         Args:
             cls (type[Integer]): cls
             positive (Natural): positive part of integer
@@ -41,10 +47,17 @@ class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural
             Integer: integer
         """
         # Avoid mutable/call defaults; compute here when None
-        pos_in = positive if positive is not None else create_natural_from_int(0)
-        neg_in = negative if negative is not None else create_natural_from_int(0)
+        pos_in = positive if positive is not None else Natural()
+        neg_in = negative if negative is not None else Natural()
 
         value = int(pos_in) - int(neg_in)
+        if cls is Integer:
+            small = _small_integers.get(value)
+            if small is not None:
+                return small  # type: ignore[return-value]
+        if not pos_in or not neg_in:
+            # One of the parts is zero, so the pair is already canonical
+            return tuple.__new__(cls, (pos_in, neg_in))
         pos = create_natural_from_int(max(value, 0))
         neg = create_natural_from_int(max(-value, 0))
         return tuple.__new__(cls, (pos, neg))
@@ -55,6 +68,14 @@ class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural
             and self.positive + other.negative == self.negative + other.positive
         )
 
+    def __hash__(self: Integer) -> int:
+        # Equivalent pairs share a value, so hash the value once per instance
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(int(self))
+            return self._hash
+
     def __ne__(self: Integer, other: object) -> bool:
         return not self == other
 
@@ -95,6 +116,33 @@ class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural
             self.positive * other.negative + self.negative * other.positive,
         )
 
+    # Floor division as with int, the remainder takes the sign of other.
+    # Each method builds only the part it returns.
+    def __floordiv__(self: Integer, other: object) -> Integer:
+        return create_integer_from_int(int(self) // _divisor(other))
+
+    def __mod__(self: Integer, other: object) -> Integer:
+        return create_integer_from_int(int(self) % _divisor(other))
+
+    def __divmod__(self: Integer, other: object) -> tuple[Integer, Integer]:
+        quotient, remainder = divmod(int(self), _divisor(other))
+        return create_integer_from_int(quotient), create_integer_from_int(remainder)
+
+    def __pow__(self: Integer, other: object, modulo: object = None) -> Integer:
+        if not isinstance(other, Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        if other < Integer():
+            raise ValueError("Exponent must be a non-negative integer.")
+        one = create_integer_from_int(1)
+        if modulo is None:
+            return _power(self, int(other), one)
+        if not isinstance(modulo, Integer):
+            raise TypeError(f"{modulo} is not 'Integer'")
+        if modulo == Integer():
+            raise ValueError("pow() 3rd argument cannot be 0")
+        # The remainder takes the sign of modulo as with int
+        return _power(self, int(other), one, lambda x: x % modulo)
+
     def __pos__(self: Integer) -> Integer:
         return self
 
@@ -107,6 +155,10 @@ class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural
     def __int__(self: Integer) -> int:
         return int(self.positive) - int(self.negative)
 
+    def __reduce__(self: Integer) -> tuple:
+        # Pickle the value only, and restore the canonical pair on load
+        return create_integer_from_int, (int(self),)
+
     @property
     def successor(self: Integer) -> Integer:
         """Get a successor number
@@ -142,10 +194,20 @@ class Integer(NamedTuple("Integer", [("positive", Natural), ("negative", Natural
             Integer: +1, -1, or 0
         """
         if self.positive == self.negative:
-            return Integer()
+            return _small_integers[0]
         if self.positive > self.negative:
-            return Integer().successor
-        return Integer().predecessor
+            return _small_integers[1]
+        return _small_integers[-1]
+
+
+def _divisor(other: object) -> int:
+    """Get the value of a divisor, rejecting non-Integers and zero"""
+    if not isinstance(other, Integer):
+        raise TypeError(f"{other} is not 'Integer'")
+    value = int(other)
+    if value == 0:
+        raise ZeroDivisionError("division by zero")
+    return value
 
 
 def create_integer_from_int(integer: int) -> Integer:
@@ -157,6 +219,100 @@ def create_integer_from_int(integer: int) -> Integer:
     Returns:
         Integer: Integer instance that represents an argument integer
     """
+    small = _small_integers.get(integer)
+    if small is not None:
+        return small
     pos = create_natural_from_int(max(integer, 0))
     neg = create_natural_from_int(max(-integer, 0))
     return Integer(pos, neg)
+
+
+def gcd(a: TNaturalOrInteger, b: TNaturalOrInteger) -> TNaturalOrInteger:
+    """Greatest common divisor by Euclid's algorithm
+
+    Each step takes a remainder with a single divmod.
+
+    Args:
+        a (Natural | Integer): number
+        b (Natural | Integer): number of the same type as a
+
+    Raises:
+        TypeError: a and b are not both Natural or both Integer
+
+    Returns:
+        Natural | Integer: non-negative greatest common divisor
+    """
+    x: Natural | Integer
+    y: Natural | Integer
+    if isinstance(a, Integer) and isinstance(b, Integer):
+        x, y = abs(a), abs(b)
+    elif isinstance(a, Natural) and isinstance(b, Natural):
+        x, y = a, b
+    else:
+        raise TypeError(f"{a} and {b} are not both 'Natural' or 'Integer'")
+    zero = type(x)()
+    while y != zero:
+        x, y = y, x % y
+    return cast(TNaturalOrInteger, x)
+
+
+def lcm(a: TNaturalOrInteger, b: TNaturalOrInteger) -> TNaturalOrInteger:
+    """Least common multiple
+
+    Args:
+        a (Natural | Integer): number
+        b (Natural | Integer): number of the same type as a
+
+    Raises:
+        TypeError: a and b are not both Natural or both Integer
+
+    Returns:
+        Natural | Integer: non-negative least common multiple
+    """
+    divisor = gcd(a, b)
+    if divisor == type(divisor)():
+        return divisor
+    multiple = a // divisor * b
+    return cast(
+        TNaturalOrInteger, abs(multiple) if isinstance(multiple, Integer) else multiple
+    )
+
+
+def set_small_integer_range(minimum: int, maximum: int) -> None:
+    """Set the range of the small integer pool
+
+    Integers in the range are preallocated once and shared, like the small
+    int cache of CPython. The range always includes -1, 0 and 1.
+
+    Args:
+        minimum (int): smallest pooled integer
+        maximum (int): largest pooled integer
+
+    Raises:
+        ValueError: range does not include -1, 0 and 1
+    """
+    global _small_integers
+    if minimum > -1 or maximum < 1:
+        raise ValueError("Range must include -1, 0 and 1.")
+    pool = {}
+    for value in range(minimum, maximum + 1):
+        small = _small_integers.get(value)
+        if small is None:
+            pos = create_natural_from_int(max(value, 0))
+            neg = create_natural_from_int(max(-value, 0))
+            small = tuple.__new__(Integer, (pos, neg))
+        pool[value] = small
+    _small_integers = pool
+
+
+def get_small_integer_range() -> tuple[int, int]:
+    """Get the range of the small integer pool
+
+    Returns:
+        tuple[int, int]: smallest and largest pooled integers
+    """
+    return min(_small_integers), max(_small_integers)
+
+
+_small_integers: dict[int, Integer] = {}
+set_small_integer_range(*DEFAULT_SMALL_INTEGER_RANGE)
@@ -2,14 +2,58 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Protocol, TypeVar
+
+DEFAULT_INTERN_CAPACITY = 1024
+DEFAULT_TOWER_LIMIT = 2048
+DEFAULT_OVERFLOW_CAPACITY = 8
+
+
+TMul = TypeVar("TMul", bound="_SupportsMul")
+
+
+class _SupportsMul(Protocol):
+    def __mul__(self: TMul, other: TMul, /) -> TMul: ...
+
 
 class Natural(tuple):
     """Natural number
 
     Natural number includes zero. Tuples are used instead of sets
     to simplify obtaining predessors.
+
+    Instances are hash-consed: a natural number is identified by its rank
+    and the intern table keeps one canonical instance per rank, so equal
+    numbers are usually the same object and share their nested tuples.
+
+    A von Neumann natural of rank n holds about n ** 2 / 2 member
+    references. Ranks up to the tower limit share one cached tower; larger
+    ranks are rebuilt on a cache miss. For ranks in the tens of thousands,
+    use the rank-backed pynumber.compact backend.
     """
 
+    def __new__(cls: type[Natural], iterable: Iterable[tuple] = ()) -> Natural:
+        """new
+
+        Return the canonical instance of the rank of ``iterable``. Only the
+        rank is taken from ``iterable``; members are always the canonical
+        ones, so arbitrary tuples are never interned.
+
+        Args:
+            cls (type[Natural]): cls
+            iterable (Iterable[tuple]): members of natural number
+
+        Returns:
+            Natural: natural number
+        """
+        members = iterable if type(iterable) is tuple else tuple(iterable)
+        if cls is not Natural:
+            return tuple.__new__(cls, members)
+        return _natural(len(members))
+
     @property
     def successor(self: Natural) -> Natural:
         """Get a successor number
@@ -20,7 +64,14 @@ class Natural(tuple):
         Returns:
             Natural: successor
         """
-        return Natural((*tuple(self), tuple(self)))
+        rank = len(self) + 1
+        if rank <= len(_tower):
+            return _natural(rank)
+        # Beyond the tower, extend self instead of rebuilding the tower
+        natural = _lookup(rank)
+        if natural is None:
+            natural = _intern(tuple.__new__(Natural, (*self, tuple(self))))
+        return natural
 
     @property
     def predecessor(self: Natural) -> Natural:
@@ -37,45 +88,84 @@ class Natural(tuple):
         """
         if self == Natural():
             raise ValueError(f"{self} does not have a predecessor")
-        return Natural(self[0:-1])
+        natural = _lookup(len(self) - 1)
+        if natural is None:
+            # The last member already has the members of the predecessor
+            natural = _intern(tuple.__new__(Natural, self[-1]))
+        return natural
 
     def __eq__(self: Natural, other: object) -> bool:
-        return isinstance(other, Natural) and tuple(self) == tuple(other)
+        # Interned instances of equal rank are identical
+        return self is other or (isinstance(other, Natural) and len(self) == len(other))
+
+    def __hash__(self: Natural) -> int:
+        # The rank is stored in the tuple header, so there is nothing to cache
+        return hash(len(self))
 
     def __ne__(self: Natural, other: object) -> bool:
         return not self == other
 
+    # The rank is the length of the tuple, so comparisons never walk members
     def __lt__(self: Natural, other: object) -> bool:
         if not isinstance(other, Natural):
             raise TypeError(f"{other} is not 'Natural'")
-        return tuple(self) in tuple(other)
+        return len(self) < len(other)
 
     def __gt__(self: Natural, other: object) -> bool:
         if not isinstance(other, Natural):
             raise TypeError(f"{other} is not 'Natural'")
-        return tuple(other) in tuple(self)
+        return len(self) > len(other)
 
     def __ge__(self: Natural, other: object) -> bool:
-        return not self < other
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return len(self) >= len(other)
 
     def __le__(self: Natural, other: object) -> bool:
-        return not self > other
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        return len(self) <= len(other)
 
     def __add__(self: Natural, other: object) -> Natural:
         if not isinstance(other, Natural):
             raise TypeError(f"{other} is not 'Natural'")
-        if other == Natural():
-            return self
-        # m + n = (m + 1) + (n - 1)
-        return self.successor + other.predecessor
+        # The rank of m + n is the sum of the ranks, so the result is taken
+        # from the tower (or extends it) without walking the operands
+        return _natural(len(self) + len(other))
 
     def __mul__(self: Natural, other: object) -> Natural:
         if not isinstance(other, Natural):
             raise TypeError(f"{other} is not 'Natural'")
         if other == Natural():
             return other
-        # m * n = m * (n - 1) + m
-        return self * other.predecessor + self
+        # The rank of m * n is the product of the ranks
+        return _natural(len(self) * len(other))
+
+    def __floordiv__(self: Natural, other: object) -> Natural:
+        return divmod(self, other)[0]
+
+    def __mod__(self: Natural, other: object) -> Natural:
+        return divmod(self, other)[1]
+
+    def __divmod__(self: Natural, other: object) -> tuple[Natural, Natural]:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        if other == Natural():
+            raise ZeroDivisionError("division by zero")
+        # m = q * n + r with r < n, found in one pass over the ranks
+        quotient, remainder = divmod(len(self), len(other))
+        return _natural(quotient), _natural(remainder)
+
+    def __pow__(self: Natural, other: object, modulo: object = None) -> Natural:
+        if not isinstance(other, Natural):
+            raise TypeError(f"{other} is not 'Natural'")
+        if modulo is None:
+            return _power(self, len(other), _natural(1))
+        if not isinstance(modulo, Natural):
+            raise TypeError(f"{modulo} is not 'Natural'")
+        if modulo == Natural():
+            raise ValueError("pow() 3rd argument cannot be 0")
+        return _power(self, len(other), _natural(1), lambda x: x % modulo)
 
     def __pos__(self: Natural) -> Natural:
         return self
@@ -83,6 +173,10 @@ class Natural(tuple):
     def __int__(self: Natural) -> int:
         return len(self)
 
+    def __reduce__(self: Natural) -> tuple:
+        # Pickle the rank only, and restore the canonical instance on load
+        return create_natural_from_int, (len(self),)
+
     def __repr__(self: Natural) -> str:
         return f"pynumber.natural.Natural({repr(tuple(self))})"
 
@@ -104,4 +198,237 @@ def create_natural_from_int(integer: int) -> Natural:
     """
     if integer < 0:
         raise ValueError("Arg must be a non-negative integer.")
-    return sum([Natural().successor] * integer, Natural())
+    return _natural(integer)
+
+
+def warm(integer: int) -> None:
+    """Build the tower up to a rank in advance
+
+    Construction cost is paid here instead of at the first use of a
+    large number. Ranks above the tower limit are not kept.
+
+    Args:
+        integer (int): highest rank to build
+
+    Raises:
+        ValueError: integer is negative
+    """
+    if integer < 0:
+        raise ValueError("Arg must be a non-negative integer.")
+    _members(min(integer, _tower_limit))
+
+
+def set_tower_limit(limit: int) -> None:
+    """Set the highest rank kept in the tower
+
+    The tower holds about limit ** 2 / 2 member references. Lowering the
+    limit evicts the top of the tower. Ranks above the limit are kept in a
+    small LRU cache instead (see set_overflow_capacity).
+
+    Args:
+        limit (int): highest rank kept in the tower
+
+    Raises:
+        ValueError: limit is negative
+    """
+    global _tower_limit
+    if limit < 0:
+        raise ValueError("Limit must be a non-negative integer.")
+    with _tower_lock:
+        _tower_limit = limit
+        del _tower[limit + 1 :]
+        _overflow.clear()
+
+
+def get_tower_limit() -> int:
+    """Get the highest rank kept in the tower
+
+    Returns:
+        int: highest rank kept in the tower
+    """
+    return _tower_limit
+
+
+def set_overflow_capacity(capacity: int) -> None:
+    """Set the number of ranks above the tower limit kept in LRU order
+
+    A rank above the limit is built from the highest cached rank below it,
+    so nearby ranks are built incrementally instead of from the tower top.
+
+    Args:
+        capacity (int): maximum number of cached ranks above the limit
+
+    Raises:
+        ValueError: capacity is negative
+    """
+    global _overflow_capacity
+    if capacity < 0:
+        raise ValueError("Capacity must be a non-negative integer.")
+    with _tower_lock:
+        _overflow_capacity = capacity
+        while len(_overflow) > capacity:
+            _overflow.popitem(last=False)
+
+
+def get_overflow_capacity() -> int:
+    """Get the number of ranks above the tower limit kept in LRU order
+
+    Returns:
+        int: maximum number of cached ranks above the limit
+    """
+    return _overflow_capacity
+
+
+def tower_height() -> int:
+    """Get the highest rank currently in the tower
+
+    Returns:
+        int: highest rank currently in the tower
+    """
+    return len(_tower) - 1
+
+
+def _power(
+    base: TMul,
+    exponent: int,
+    one: TMul,
+    reduce: Callable[[TMul], TMul] | None = None,
+) -> TMul:
+    """Raise base to a non-negative exponent by square-and-multiply
+
+    Only O(log exponent) multiplications are made. When reduce is given,
+    it is applied after every multiplication, e.g. to take a remainder.
+    """
+    result = one
+    if reduce is not None:
+        result, base = reduce(result), reduce(base)
+    while exponent:
+        if exponent & 1:
+            result = result * base
+            if reduce is not None:
+                result = reduce(result)
+        exponent >>= 1
+        if exponent:
+            base = base * base
+            if reduce is not None:
+                base = reduce(base)
+    return result
+
+
+# Prefix cache of plain member tuples, _tower[n] == (_tower[0], ..., _tower[n - 1])
+_tower: list[tuple] = [()]
+_tower_limit: int = DEFAULT_TOWER_LIMIT
+_tower_lock = threading.Lock()
+# Recently built ranks above the tower limit, least recently used first
+_overflow: OrderedDict[int, tuple] = OrderedDict()
+_overflow_capacity: int = DEFAULT_OVERFLOW_CAPACITY
+
+
+def _members(rank: int) -> tuple:
+    """Get the shared member tuple of rank, growing the tower from its top"""
+    try:
+        return _tower[rank]
+    except IndexError:
+        pass
+    with _tower_lock:
+        if rank < len(_tower):
+            return _tower[rank]
+        members = _overflow.get(rank)
+        if members is not None:
+            _overflow.move_to_end(rank)
+            return members
+        # Start from the highest cached rank below, or from the tower top
+        start = max((r for r in _overflow if r < rank), default=len(_tower) - 1)
+        members = _overflow[start] if start in _overflow else _tower[-1]
+        for height in range(start + 1, rank + 1):
+            # n + 1 = n U {n}
+            members = (*members, members)
+            if height <= _tower_limit:
+                _tower.append(members)
+        if rank > _tower_limit and _overflow_capacity:
+            _overflow[rank] = members
+            while len(_overflow) > _overflow_capacity:
+                _overflow.popitem(last=False)
+        return members
+
+
+def _natural(rank: int) -> Natural:
+    """Get the canonical instance of rank"""
+    natural = _lookup(rank)
+    if natural is None:
+        natural = _intern(tuple.__new__(Natural, _members(rank)))
+    return natural
+
+
+_interned: OrderedDict[int, Natural] = OrderedDict()
+_intern_capacity: int | None = DEFAULT_INTERN_CAPACITY
+_intern_lock = threading.Lock()
+
+
+def _lookup(rank: int) -> Natural | None:
+    """Look up the canonical instance of rank and mark it as recently used"""
+    with _intern_lock:
+        natural = _interned.get(rank)
+        if natural is not None:
+            _interned.move_to_end(rank)
+        return natural
+
+
+def _intern(natural: Natural) -> Natural:
+    """Register natural as canonical unless another thread won the race"""
+    rank = len(natural)
+    with _intern_lock:
+        canonical = _interned.setdefault(rank, natural)
+        _interned.move_to_end(rank)
+        if _intern_capacity is not None:
+            while len(_interned) > _intern_capacity:
+                _interned.popitem(last=False)
+    return canonical
+
+
+def set_intern_capacity(capacity: int | None) -> None:
+    """Set the capacity of the intern table
+
+    Tuple subclasses cannot be weakly referenced, so the table holds strong
+    references and evicts the least recently used ranks beyond capacity.
+    Evicted numbers stay valid; equality falls back to comparing ranks.
+
+    Args:
+        capacity (int | None): maximum number of interned ranks, or None
+            for an unbounded table
+
+    Raises:
+        ValueError: capacity is negative
+    """
+    global _intern_capacity
+    if capacity is not None and capacity < 0:
+        raise ValueError("Capacity must be a non-negative integer or None.")
+    with _intern_lock:
+        _intern_capacity = capacity
+        if capacity is not None:
+            while len(_interned) > capacity:
+                _interned.popitem(last=False)
+
+
+def get_intern_capacity() -> int | None:
+    """Get the capacity of the intern table
+
+    Returns:
+        int | None: maximum number of interned ranks, or None if unbounded
+    """
+    return _intern_capacity
+
+
+def clear_intern_table() -> None:
+    """Drop every canonical instance from the intern table"""
+    with _intern_lock:
+        _interned.clear()
+
+
+def intern_table_size() -> int:
+    """Get the number of interned ranks
+
+    Returns:
+        int: number of canonical instances in the intern table
+    """
+    return len(_interned)
@@ -0,0 +1,269 @@
+"""Opt-in operation counters
+
+While profiling is enabled, the methods of the number classes and the
+hot-path functions of their modules are replaced by counting wrappers.
+They are restored when profiling is disabled, so disabled profiling has no
+overhead at all.
+
+For every class (or module) and operation, a profile records:
+
+- calls: number of calls
+- allocations: numbers and tower tuples built during the calls
+- max_depth: deepest nesting of the operation in itself
+- seconds: cumulative time, including nested calls
+
+Use the context manager::
+
+    with pynumber.profile() as stats:
+        a * b + c
+    print(stats.to_json())
+
+or set ``PYNUMBER_PROFILE`` before importing pynumber to profile the whole
+process and write the JSON at exit, to stderr for ``1`` or ``-`` and to a
+file otherwise. Module functions are counted only when called through a
+module attribute, not through a reference imported before enabling.
+Counters are not synchronized between threads.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Any
+
+from pynumber import compact, integer, natural, rational
+
+# An allocation hook is called with the arguments before a call and returns
+# a function that counts the allocations from its result
+AllocationHook = Callable[[tuple], Callable[[Any], int]]
+
+
+def _one(args: tuple) -> Callable[[Any], int]:
+    return lambda result: 1
+
+
+def _tower_growth(args: tuple) -> Callable[[Any], int]:
+    height = len(natural._tower)
+    rank = args[0]
+    return lambda result: max(rank + 1 - height, 0)
+
+
+def _unpooled(args: tuple) -> Callable[[Any], int]:
+    # Take the value from the tuple lengths, not from the wrapped __int__
+    def count(result: Any) -> int:
+        value = len(result[0]) - len(result[1])
+        return int(result is not integer._small_integers.get(value))
+
+    return count
+
+
+_CLASSES: tuple[type, ...] = (
+    natural.Natural,
+    integer.Integer,
+    rational.Rational,
+    compact.Natural,
+    compact.Integer,
+)
+_FUNCTIONS: dict[ModuleType, tuple[str, ...]] = {
+    natural: ("create_natural_from_int", "_intern", "_members"),
+    integer: ("create_integer_from_int", "gcd", "lcm"),
+    rational: ("_reduce",),
+    compact: (
+        "create_natural_from_int",
+        "create_integer_from_int",
+        "gcd",
+        "lcm",
+        "_natural",
+        "_integer",
+    ),
+}
+_HOOKS: dict[tuple[str, str], AllocationHook] = {
+    ("natural", "_intern"): _one,
+    ("natural", "_members"): _tower_growth,
+    ("integer.Integer", "__new__"): _unpooled,
+    ("rational.Rational", "__new__"): _one,
+    ("rational", "_reduce"): _one,
+    ("compact", "_natural"): _one,
+    ("compact", "_integer"): _one,
+}
+
+
+class Profile:
+    """Counters of a profiling session"""
+
+    def __init__(self: Profile) -> None:
+        self._stats: dict[str, dict[str, dict[str, float]]] = {}
+
+    def _record(
+        self: Profile,
+        group: str,
+        name: str,
+        seconds: float,
+        allocations: int,
+        depth: int,
+    ) -> None:
+        stats = self._stats.setdefault(group, {}).setdefault(
+            name, {"calls": 0, "allocations": 0, "max_depth": 0, "seconds": 0.0}
+        )
+        stats["calls"] += 1
+        stats["allocations"] += allocations
+        stats["max_depth"] = max(stats["max_depth"], depth)
+        stats["seconds"] += seconds
+
+    def as_dict(self: Profile) -> dict[str, dict[str, dict[str, float]]]:
+        """Get the counters
+
+        Returns:
+            dict: counters keyed by class or module, then by operation
+        """
+        return {
+            group: {name: dict(stats) for name, stats in operations.items()}
+            for group, operations in self._stats.items()
+        }
+
+    def to_json(self: Profile, **kwargs: Any) -> str:
+        """Get the counters as JSON
+
+        Args:
+            **kwargs: keyword arguments of json.dumps
+
+        Returns:
+            str: counters as JSON
+        """
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+_active: list[Profile] = []
+_originals: list[tuple[Any, str, Any]] = []
+_depths: dict[tuple[str, str], int] = {}
+_allocated = 0
+
+
+def _wrap(group: str, name: str, func: Callable) -> Callable:
+    """Wrap func to record its calls in the active profiles"""
+    key = (group, name)
+    hook = _HOOKS.get(key)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _allocated
+        depth = _depths.get(key, 0) + 1
+        _depths[key] = depth
+        count = hook(args) if hook is not None else None
+        allocated = _allocated
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            if count is not None:
+                _allocated += count(result)
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            _depths[key] = depth - 1
+            for session in _active:
+                session._record(group, name, seconds, _allocated - allocated, depth)
+
+    return wrapper
+
+
+def _patch(owner: Any, name: str, replacement: Any) -> None:
+    _originals.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, replacement)
+
+
+def _enable() -> None:
+    """Replace methods and functions by counting wrappers"""
+    for cls in _CLASSES:
+        group = f"{cls.__module__.removeprefix('pynumber.')}.{cls.__name__}"
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith("_") and not name.startswith("__"):
+                continue
+            if isinstance(attribute, staticmethod):
+                wrapped: Any = staticmethod(_wrap(group, name, attribute.__func__))
+            elif isinstance(attribute, property) and attribute.fget is not None:
+                wrapped = property(_wrap(group, name, attribute.fget))
+            elif callable(attribute):
+                wrapped = _wrap(group, name, attribute)
+            else:
+                continue
+            _patch(cls, name, wrapped)
+    modules = [
+        module
+        for module_name, module in list(sys.modules.items())
+        if module_name == "pynumber" or module_name.startswith("pynumber.")
+    ]
+    for owner, names in _FUNCTIONS.items():
+        group = owner.__name__.removeprefix("pynumber.")
+        for name in names:
+            original = getattr(owner, name)
+            wrapped = _wrap(group, name, original)
+            # Rebind every module attribute referring to the function
+            for module in modules:
+                for attribute, value in list(vars(module).items()):
+                    if value is original:
+                        _patch(module, attribute, wrapped)
+
+
+def _disable() -> None:
+    """Restore methods and functions"""
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    _depths.clear()
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Profile the operations run in the context
+
+    Profiles can be nested; every active profile records every operation.
+
+    Yields:
+        Profile: counters of the context
+    """
+    session = Profile()
+    if not _active:
+        _enable()
+    _active.append(session)
+    try:
+        yield session
+    finally:
+        _active.remove(session)
+        if not _active:
+            _disable()
+
+
+def is_enabled() -> bool:
+    """Check whether profiling is enabled
+
+    Returns:
+        bool: True while a profile is active
+    """
+    return bool(_active)
+
+
+def _profile_process(target: str) -> None:
+    """Profile until exit and write the counters to target"""
+    context = profile()
+    session = context.__enter__()
+
+    def dump() -> None:
+        context.__exit__(None, None, None)
+        if target in ("1", "-"):
+            print(session.to_json(indent=2), file=sys.stderr)
+        else:
+            with open(target, "w") as file:
+                file.write(session.to_json(indent=2))
+
+    atexit.register(dump)
+
+
+if os.environ.get("PYNUMBER_PROFILE", "0") != "0":
+    _profile_process(os.environ["PYNUMBER_PROFILE"])
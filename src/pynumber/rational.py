@@ -1,11 +1,20 @@
-"""Set-theoretic construction of rational numbers"""
+"""Set-theoretic construction of rational numbers
+
+Rational works with the Integer of either backend: results are built
+with the backend of their operands, so a module can select a backend by
+importing from pynumber.integer or pynumber.compact. The Integer exported
+by the package (see pynumber.backend) is used for defaults only.
+"""
 
 from __future__ import annotations
 
-import math
+from types import ModuleType
 from typing import NamedTuple
 
-from pynumber.integer import Integer, create_integer_from_int
+from pynumber import compact, integer
+from pynumber.backend import Integer, create_integer_from_int
+
+DEFAULT_LAZY_THRESHOLD = 1024
 
 
 class Rational(
@@ -15,6 +24,9 @@ class Rational(
 
         Rational is defined by localization of Integer.
 
+        In lazy mode (see set_lazy_normalization), numerator and denominator
+        are kept as given until the number is compared, hashed or printed.
+
     .. _Reference:
         https://en.wikipedia.org/wiki/Localization_(commutative_algebra)
     """
@@ -26,7 +38,8 @@ class Rational(
     ) -> Rational:
         """new
 
-        change denominator to be positive
+        change denominator to be positive and reduce the fraction,
+        unless lazy mode defers it
 
         Args:
             cls (type[Rational]): cls
@@ -39,11 +52,11 @@ class Rational(
         Returns:
             Rational: rational number
         """
-        if denominator is None:
-            denominator = create_integer_from_int(1)
         if numerator is None:
-            numerator = Integer()
-        if denominator == Integer():
+            numerator = Integer() if denominator is None else type(denominator)()
+        if denominator is None:
+            denominator = _one(numerator)
+        if int(denominator) == 0:
             raise ZeroDivisionError("division by zero")
 
         #### For better performance, a canonical representative is selected,
@@ -51,24 +64,50 @@ class Rational(
         #    sign = (numerator.sign * denominator.sign).sign
         #    return super().__new__(cls, sign*abs(numerator), abs(denominator))
 
-        # Change a denominator to be positive
-        sign = int((numerator.sign * denominator.sign).sign)
-        int_numerator = sign * abs(int(numerator))
-        int_denominator = abs(int(denominator))
-        gcd = math.gcd(int_numerator, int_denominator)
-        return tuple.__new__(
-            cls,
-            (
-                create_integer_from_int(int_numerator // gcd),
-                create_integer_from_int(int_denominator // gcd),
-            ),
-        )
+        threshold = _lazy_threshold
+        if threshold is None:
+            return _reduce(cls, numerator, denominator)
+        if max(abs(int(numerator)), abs(int(denominator))) > threshold:
+            return _reduce(cls, numerator, denominator)
+        rational = tuple.__new__(cls, (numerator, denominator))
+        rational._reduced = False
+        return rational
+
+    _reduced: bool = True
+
+    def normalize(self: Rational) -> Rational:
+        """Get the reduced representative
+
+        Args:
+            self (Rational): Rational instance
+
+        Returns:
+            Rational: self if already reduced, otherwise an equal Rational
+            with coprime parts and a positive denominator
+        """
+        if self._reduced:
+            return self
+        try:
+            return self._normal
+        except AttributeError:
+            self._normal: Rational = _reduce(type(self), *self)
+            return self._normal
 
     def __eq__(self: Rational, other: object) -> bool:
-        return (
-            isinstance(other, Rational)
-            and self.numerator * other.denominator == self.denominator * other.numerator
-        )
+        if not isinstance(other, Rational):
+            return False
+        a, b = self.normalize(), other.normalize()
+        return a.numerator * b.denominator == a.denominator * b.numerator
+
+    def __hash__(self: Rational) -> int:
+        # Reduced instances have a positive denominator, so equal numbers
+        # have equal parts
+        try:
+            return self._hash
+        except AttributeError:
+            normal = self.normalize()
+            self._hash: int = hash((int(normal.numerator), int(normal.denominator)))
+            return self._hash
 
     def __ne__(self: Rational, other: object) -> bool:
         return not self == other
@@ -76,12 +115,14 @@ class Rational(
     def __lt__(self: Rational, other: object) -> bool:
         if not isinstance(other, Rational):
             raise TypeError(f"{other} is not 'Rational'")
-        return self.numerator * other.denominator < self.denominator * other.numerator
+        a, b = self.normalize(), other.normalize()
+        return a.numerator * b.denominator < a.denominator * b.numerator
 
     def __gt__(self: Rational, other: object) -> bool:
         if not isinstance(other, Rational):
             raise TypeError(f"{other} is not 'Rational'")
-        return self.numerator * other.denominator > self.denominator * other.numerator
+        a, b = self.normalize(), other.normalize()
+        return a.numerator * b.denominator > a.denominator * b.numerator
 
     def __ge__(self: Rational, other: object) -> bool:
         return not self < other
@@ -123,4 +164,100 @@ class Rational(
             self.numerator * other.denominator, self.denominator * other.numerator
         )
 
+    def __pow__(self: Rational, other: object) -> Rational:
+        if not isinstance(other, Integer | compact.Integer):
+            raise TypeError(f"{other} is not 'Integer'")
+        numerator, denominator = self.normalize()
+        if int(other) < 0:
+            if int(numerator) == 0:
+                raise ZeroDivisionError("division by zero")
+            # (a / b) ** -n = (b / a) ** n, keeping the denominator positive
+            other = -other
+            numerator, denominator = denominator * numerator.sign, abs(numerator)
+        # The parts are coprime, so are their powers and no gcd is needed
+        return tuple.__new__(type(self), (numerator**other, denominator**other))
+
+    def __reduce__(self: Rational) -> tuple:
+        # Pickle the values of the reduced parts only
+        normal = self.normalize()
+        return create_rational_from_ints, (
+            int(normal.numerator),
+            int(normal.denominator),
+        )
+
+    def __repr__(self: Rational) -> str:
+        return super(Rational, self.normalize()).__repr__()
+
     # unary operator can be added if needed in the future
+
+
+def create_rational_from_ints(numerator: int, denominator: int = 1) -> Rational:
+    """Create Rational from integers
+
+    Args:
+        numerator (int): numerator
+        denominator (int): denominator (defaults to 1)
+
+    Raises:
+        ZeroDivisionError: denominator is zero
+
+    Returns:
+        Rational: Rational instance that represents numerator / denominator
+    """
+    return Rational(
+        create_integer_from_int(numerator), create_integer_from_int(denominator)
+    )
+
+
+def _backend_of(number: object) -> ModuleType:
+    """Get the backend module of an Integer"""
+    return compact if isinstance(number, compact.Integer) else integer
+
+
+def _one(number: Integer) -> Integer:
+    """Get one in the backend of number"""
+    return _backend_of(number).create_integer_from_int(1)
+
+
+def _reduce(cls: type[Rational], numerator: Integer, denominator: Integer) -> Rational:
+    """Build the reduced representative with a positive denominator"""
+    # Change a denominator to be positive
+    if int(denominator) < 0:
+        numerator, denominator = -numerator, -denominator
+    # Reduce only when needed, so reduced operands are reused as they are
+    divisor = _backend_of(denominator).gcd(numerator, denominator)
+    if int(divisor) != 1:
+        numerator, denominator = numerator // divisor, denominator // divisor
+    return tuple.__new__(cls, (numerator, denominator))
+
+
+def set_lazy_normalization(threshold: int | None) -> None:
+    """Enable or disable lazy normalization
+
+    In lazy mode, arithmetic results are not reduced until they are
+    compared, hashed or printed, or until their numerator or denominator
+    grows past threshold in absolute value.
+
+    Args:
+        threshold (int | None): size that forces reduction, or None for
+            eager mode
+
+    Raises:
+        ValueError: threshold is negative
+    """
+    global _lazy_threshold
+    if threshold is not None and threshold < 0:
+        raise ValueError("Threshold must be a non-negative integer or None.")
+    _lazy_threshold = threshold
+
+
+def get_lazy_normalization() -> int | None:
+    """Get the threshold of lazy normalization
+
+    Returns:
+        int | None: size that forces reduction, or None in eager mode
+    """
+    return _lazy_threshold
+
+
+_lazy_threshold: int | None = None
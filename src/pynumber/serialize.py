@@ -0,0 +1,162 @@
+"""Compact binary format for numbers
+
+A stream starts with the header ``b"PYNUM\\x01"`` and holds one record per
+number. A record is a tag byte followed by LEB128 varints:
+
+- ``N``: rank of a Natural
+- ``I``: zigzag-encoded value of an Integer
+- ``R``: zigzag-encoded numerator and positive denominator of a reduced
+  Rational
+
+Records are written and read one at a time, so dump_many and load_many run
+in constant memory however many numbers a stream holds. Numbers are loaded
+as canonical instances of the selected backend.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from pynumber import compact, integer, natural
+from pynumber.backend import create_integer_from_int, create_natural_from_int
+from pynumber.rational import Rational, create_rational_from_ints
+
+MAGIC = b"PYNUM\x01"
+
+Number = (
+    natural.Natural | integer.Integer | compact.Natural | compact.Integer | Rational
+)
+
+_NATURALS = (natural.Natural, compact.Natural)
+_INTEGERS = (integer.Integer, compact.Integer)
+
+
+def dump_many(numbers: Iterable[Number], file: BinaryIO) -> int:
+    """Write numbers to a binary file
+
+    Args:
+        numbers (Iterable[Number]): numbers to write, consumed lazily
+        file (BinaryIO): file opened for binary writing
+
+    Raises:
+        TypeError: an item is not a number
+
+    Returns:
+        int: number of numbers written
+    """
+    file.write(MAGIC)
+    count = 0
+    for number in numbers:
+        file.write(_record(number))
+        count += 1
+    return count
+
+
+def load_many(file: BinaryIO) -> Iterator[Number]:
+    """Read numbers from a binary file written by dump_many
+
+    Args:
+        file (BinaryIO): file opened for binary reading
+
+    Raises:
+        ValueError: the stream is not in this format or is truncated
+
+    Yields:
+        Number: numbers in the order they were written
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a pynumber stream")
+    while tag := file.read(1):
+        if tag == b"N":
+            yield create_natural_from_int(_read_varint(file))
+        elif tag == b"I":
+            yield create_integer_from_int(_unzigzag(_read_varint(file)))
+        elif tag == b"R":
+            numerator = _unzigzag(_read_varint(file))
+            denominator = _read_varint(file)
+            yield create_rational_from_ints(numerator, denominator)
+        else:
+            raise ValueError(f"unknown record tag {tag!r}")
+
+
+def dumps(number: Number) -> bytes:
+    """Encode a number
+
+    Args:
+        number (Number): number
+
+    Raises:
+        TypeError: number is not a number
+
+    Returns:
+        bytes: header and a single record
+    """
+    return MAGIC + _record(number)
+
+
+def loads(data: bytes) -> Number:
+    """Decode a number encoded by dumps
+
+    Args:
+        data (bytes): encoded number
+
+    Raises:
+        ValueError: data does not hold exactly one number
+
+    Returns:
+        Number: decoded number
+    """
+    numbers = list(load_many(io.BytesIO(data)))
+    if len(numbers) != 1:
+        raise ValueError(f"expected one number, got {len(numbers)}")
+    return numbers[0]
+
+
+def _record(number: Number) -> bytes:
+    """Encode a number as a tagged record"""
+    if isinstance(number, _NATURALS):
+        return b"N" + _varint(len(number))
+    if isinstance(number, _INTEGERS):
+        return b"I" + _varint(_zigzag(int(number)))
+    if isinstance(number, Rational):
+        normal = number.normalize()
+        return (
+            b"R"
+            + _varint(_zigzag(int(normal.numerator)))
+            + _varint(int(normal.denominator))
+        )
+    raise TypeError(f"{number} is not a number")
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative integer as LEB128"""
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_varint(file: BinaryIO) -> int:
+    """Decode a LEB128 integer from file"""
+    value = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            raise ValueError("truncated pynumber stream")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    # 0, -1, 1, -2, 2, ... are mapped to 0, 1, 2, 3, 4, ...
+    return 2 * value if value >= 0 else -2 * value - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if value % 2 == 0 else -(value >> 1) - 1
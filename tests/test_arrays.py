@@ -0,0 +1,97 @@
+"""Test arrays of numbers"""
+
+import pytest
+
+from pynumber import (
+    Integer,
+    Natural,
+    Rational,
+    create_integer_from_int,
+    create_natural_from_int,
+)
+from pynumber.arrays import IntegerArray, NaturalArray, RationalArray, _ValueArray
+
+
+def rational(numerator: int, denominator: int = 1) -> Rational:
+    return Rational(
+        create_integer_from_int(numerator), create_integer_from_int(denominator)
+    )
+
+
+def test_natural_array() -> None:
+    """Test NaturalArray"""
+    naturals = [create_natural_from_int(n) for n in (3, 0, 5)]
+    array = NaturalArray(naturals)
+    assert len(array) == 3
+    assert array.to_list() == naturals
+    assert array[2] == create_natural_from_int(5)
+    assert array[1:].to_ints() == [0, 5]
+    assert (array + array).to_ints() == [6, 0, 10]
+    assert (array * create_natural_from_int(2)).to_ints() == [6, 0, 10]
+    assert (array // NaturalArray.from_ints([2, 1, 2])).to_ints() == [1, 0, 2]
+    assert (array % NaturalArray.from_ints([2, 1, 2])).to_ints() == [1, 0, 1]
+    assert (array < create_natural_from_int(4)) == [True, True, False]
+    assert (array == array) == [True, True, True]
+    assert array.sum() == create_natural_from_int(8)
+    assert array.prod() == Natural()
+    assert array.min() == Natural()
+    assert array.max() == create_natural_from_int(5)
+    assert NaturalArray().sum() == Natural()
+    with pytest.raises(ValueError):
+        _ = array + NaturalArray.from_ints([1])
+    with pytest.raises(ValueError):
+        _ = NaturalArray.from_ints([-1])
+    with pytest.raises(ZeroDivisionError):
+        _ = array // Natural()
+    with pytest.raises(TypeError):
+        _ = NaturalArray([create_integer_from_int(1)])
+    with pytest.raises(TypeError):
+        _ = {array}
+    with pytest.raises(TypeError):
+        _ = _ValueArray()  # type: ignore[abstract]
+
+
+def test_integer_array() -> None:
+    """Test IntegerArray"""
+    array = IntegerArray.from_ints([-3, 0, 7])
+    assert array.to_list() == [create_integer_from_int(n) for n in (-3, 0, 7)]
+    assert IntegerArray(array.to_list()).to_ints() == [-3, 0, 7]
+    assert (array - create_integer_from_int(1)).to_ints() == [-4, -1, 6]
+    assert (-array).to_ints() == [3, 0, -7]
+    assert abs(array).to_ints() == [3, 0, 7]
+    assert (array // create_integer_from_int(2)).to_ints() == [-2, 0, 3]
+    assert (array % create_integer_from_int(2)).to_ints() == [1, 0, 1]
+    assert (array >= Integer()) == [False, True, True]
+    assert array.sum() == create_integer_from_int(4)
+    assert array.min() == create_integer_from_int(-3)
+    with pytest.raises(ValueError):
+        _ = IntegerArray().max()
+
+
+def test_rational_array() -> None:
+    """Test RationalArray"""
+    array = RationalArray.from_ints([1, 2, -3], [2, -4, 9])
+    assert array.to_ints() == [(1, 2), (-1, 2), (-1, 3)]
+    assert array.to_list() == [rational(1, 2), rational(-1, 2), rational(-1, 3)]
+    assert RationalArray(array.to_list()).to_ints() == array.to_ints()
+    assert (array + rational(1, 2)).to_ints() == [(1, 1), (0, 1), (1, 6)]
+    assert (array - array).to_ints() == [(0, 1)] * 3
+    assert (array * rational(-2)).to_ints() == [(-1, 1), (1, 1), (2, 3)]
+    assert (array / rational(1, 3)).to_ints() == [(3, 2), (-3, 2), (-1, 1)]
+    assert (-array)[0] == rational(-1, 2)
+    assert (array < Rational()) == [False, True, True]
+    assert (array == rational(-1, 2)) == [False, True, False]
+    assert array.sum() == rational(-1, 3)
+    assert array.prod() == rational(1, 12)
+    assert array.min() == rational(-1, 2)
+    assert array.max() == rational(1, 2)
+    assert RationalArray().sum() == Rational()
+    assert RationalArray().prod() == rational(1)
+    with pytest.raises(ZeroDivisionError):
+        _ = array / Rational()
+    with pytest.raises(ZeroDivisionError):
+        _ = RationalArray.from_ints([1], [0])
+    with pytest.raises(ValueError):
+        _ = RationalArray.from_ints([1], [1, 2])
+    with pytest.raises(TypeError):
+        _ = array + create_integer_from_int(1)
@@ -0,0 +1,110 @@
+"""Test compact backend"""
+
+from collections.abc import Callable
+
+import pytest
+
+from pynumber import compact, integer, natural
+from pynumber.rational import Rational
+from tests import test_integer, test_natural
+
+
+def _shared_tests() -> list[Callable[[], None]]:
+    tests = []
+    for module in (test_natural, test_integer):
+        for name, test in vars(module).items():
+            marks = getattr(test, "pytestmark", [])
+            if name.startswith("test_") and not any(
+                mark.name == "skipif" for mark in marks
+            ):
+                tests.append(test)
+    return tests
+
+
+@pytest.mark.parametrize("test", _shared_tests(), ids=lambda test: test.__name__)
+def test_shared_suite(
+    test: Callable[[], None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the suites of Natural and Integer against the compact backend"""
+    for module in (test_natural, test_integer):
+        for name in (
+            "Natural",
+            "Integer",
+            "create_natural_from_int",
+            "create_integer_from_int",
+            "gcd",
+            "lcm",
+        ):
+            if hasattr(module, name):
+                monkeypatch.setattr(module, name, getattr(compact, name))
+    test()
+
+
+def test_materialization() -> None:
+    """Test set-theoretic tuples are built on demand"""
+    three = compact.create_natural_from_int(3)
+    assert three.__slots__ == ("_rank",)
+    assert tuple(three) == tuple(natural.create_natural_from_int(3))
+    assert three[-1] is natural.create_natural_from_int(3)[-1]
+    assert three[1:] == natural.create_natural_from_int(3)[1:]
+    assert ((),) in three and three[2] in three and tuple(three) not in three
+    assert ("junk",) not in three and ((), ()) not in three
+    with pytest.raises(IndexError):
+        _ = three[3]
+    a, b, c = three
+    assert (len(a), len(b), len(c)) == (0, 1, 2)
+    assert three.materialize() is natural.create_natural_from_int(3)
+    assert compact.Natural(natural.create_natural_from_int(3)) == three
+    assert compact.Natural(iter([(), ((),)])) == compact.create_natural_from_int(2)
+
+
+def test_iteration_beyond_tower_limit() -> None:
+    """Test iteration above the tower limit keeps sharing members"""
+    limit = natural.get_tower_limit()
+    try:
+        natural.set_tower_limit(3)
+        members = list(compact.create_natural_from_int(6))
+        assert [len(member) for member in members] == list(range(6))
+        assert members[5][4] is members[4]
+        assert natural.tower_height() == 3
+    finally:
+        natural.set_tower_limit(limit)
+
+
+def test_large_arithmetic() -> None:
+    """Test arithmetic on operands in the tens of thousands"""
+    a = compact.create_natural_from_int(30_000)
+    b = compact.create_natural_from_int(45_000)
+    assert int(a + b) == 75_000
+    assert int(a * b) == 1_350_000_000
+    assert int(b // a) == 1 and int(b % a) == 15_000
+    assert (a + b).predecessor == compact.create_natural_from_int(74_999)
+
+
+def test_compact_integer() -> None:
+    """Test compact Integer"""
+    minus_two = compact.create_integer_from_int(-2)
+    positive, negative = minus_two
+    assert (int(positive), int(negative)) == (0, 2)
+    assert minus_two[1] == compact.create_natural_from_int(2)
+    assert minus_two.materialize() == integer.create_integer_from_int(-2)
+    assert repr(minus_two) == "pynumber.compact.create_integer_from_int(-2)"
+    assert str(compact.create_natural_from_int(2)) == "Natural: 2"
+    assert minus_two != integer.create_integer_from_int(-2)
+
+
+def test_rational() -> None:
+    """Test Rational keeps the backend of its operands"""
+    one, two = compact.create_integer_from_int(1), compact.create_integer_from_int(2)
+    half = Rational(one, -two)  # type: ignore[arg-type]
+    assert type(half.numerator) is compact.Integer
+    assert (int(half.numerator), int(half.denominator)) == (-1, 2)
+    third = Rational(two, compact.create_integer_from_int(6))  # type: ignore[arg-type]
+    total = half + third
+    assert type(total.denominator) is compact.Integer
+    assert (int(total.numerator), int(total.denominator)) == (-1, 6)
+    square = half**two  # type: ignore[operator]
+    assert (int(square.numerator), int(square.denominator)) == (1, 4)
+    assert type(Rational(one).denominator) is compact.Integer  # type: ignore[arg-type]
+    with_set = Rational(integer.create_integer_from_int(3))
+    assert type(with_set.denominator) is integer.Integer
@@ -1,8 +1,17 @@
 """Test Integer class"""
 
+import pickle
+
 import pytest
 
-from pynumber import Integer, Natural, create_integer_from_int
+from pynumber import Integer, Natural, create_integer_from_int, gcd, lcm
+from pynumber.backend import get_backend
+from pynumber.integer import get_small_integer_range, set_small_integer_range
+from pynumber.profiling import profile
+
+set_backend_only = pytest.mark.skipif(
+    get_backend() != "set", reason="specific to the set-theoretic backend"
+)
 
 
 def test_equality() -> None:
@@ -65,6 +74,68 @@ def test_multiplication() -> None:
         _ = zero * Natural()
 
 
+def test_division() -> None:
+    """Test floor division and modulo as with int"""
+    for a in (-7, -6, 0, 6, 7):
+        for b in (-3, 3):
+            quotient, remainder = divmod(
+                create_integer_from_int(a), create_integer_from_int(b)
+            )
+            assert (int(quotient), int(remainder)) == divmod(a, b)
+            assert create_integer_from_int(a) // create_integer_from_int(b) == (
+                quotient
+            )
+            assert create_integer_from_int(a) % create_integer_from_int(b) == (
+                remainder
+            )
+    with pytest.raises(ZeroDivisionError):
+        _ = create_integer_from_int(1) // Integer()
+    with pytest.raises(TypeError):
+        _ = create_integer_from_int(1) % Natural()
+
+
+@set_backend_only
+def test_division_builds_one_part() -> None:
+    """Test // and % build only the part they return"""
+    a, b = create_integer_from_int(700), create_integer_from_int(3)
+    with profile() as stats:
+        _ = a // b
+        _ = a % b
+    assert stats.as_dict()["integer"]["create_integer_from_int"]["calls"] == 2
+
+
+def test_gcd() -> None:
+    """Test gcd and lcm"""
+    minus_four = create_integer_from_int(-4)
+    six = create_integer_from_int(6)
+    assert gcd(minus_four, six) == create_integer_from_int(2)
+    assert gcd(minus_four, Integer()) == create_integer_from_int(4)
+    assert lcm(minus_four, six) == create_integer_from_int(12)
+    assert lcm(Integer(), six) == Integer()
+    with pytest.raises(TypeError):
+        _ = gcd(six, Natural())  # type: ignore[arg-type]
+
+
+def test_power() -> None:
+    """Test power"""
+    minus_three = create_integer_from_int(-3)
+    assert minus_three ** create_integer_from_int(3) == create_integer_from_int(-27)
+    assert minus_three ** create_integer_from_int(2) == create_integer_from_int(9)
+    assert minus_three ** Integer() == create_integer_from_int(1)
+    assert pow(
+        minus_three, create_integer_from_int(5), create_integer_from_int(7)
+    ) == create_integer_from_int(2)
+    assert pow(
+        minus_three, create_integer_from_int(5), create_integer_from_int(-7)
+    ) == create_integer_from_int(-5)
+    with pytest.raises(ValueError):
+        _ = minus_three ** create_integer_from_int(-1)
+    with pytest.raises(ValueError):
+        _ = pow(minus_three, minus_three.sign.sign, Integer())
+    with pytest.raises(TypeError):
+        _ = minus_three ** Natural()
+
+
 def test_unary_arithmetic_operation() -> None:
     """Test unary arithmetic operation"""
     minus_one = Integer(Natural().successor, Natural().successor.successor)
@@ -104,3 +175,56 @@ def test_create_from_int() -> None:
     assert create_integer_from_int(0) == zero
     assert create_integer_from_int(-1) == minus_one
     assert create_integer_from_int(1) == one
+
+
+def test_hash() -> None:
+    """Test __hash__"""
+    one = Integer(Natural().successor, Natural())
+    one2 = Integer(Natural().successor.successor, Natural().successor)
+    assert hash(one) == hash(one2)
+    assert len({one, one2, create_integer_from_int(-1)}) == 2
+    assert {one: "one"}[create_integer_from_int(1)] == "one"
+
+
+@set_backend_only
+def test_small_integer_pool() -> None:
+    """Test canonicalization reuses pooled and canonical instances"""
+    minimum, maximum = get_small_integer_range()
+    try:
+        one = Integer(Natural().successor, Natural())
+        assert Integer(Natural().successor.successor, Natural().successor) is one
+        assert create_integer_from_int(1) is one
+        assert (-one).sign is create_integer_from_int(-1)
+        assert Integer().sign is Integer()
+        set_small_integer_range(-1, 1)
+        assert get_small_integer_range() == (-1, 1)
+        assert create_integer_from_int(1) is one
+        five = Natural().successor.successor.successor.successor.successor
+        big = Integer(five, Natural())
+        assert big.positive is five
+        assert int(Integer(five, five.predecessor)) == 1
+        assert create_integer_from_int(5) is not create_integer_from_int(5)
+        with pytest.raises(ValueError):
+            set_small_integer_range(0, 1)
+    finally:
+        set_small_integer_range(minimum, maximum)
+
+
+def test_pickle() -> None:
+    """Test pickling stores the value only"""
+    for value in (0, 7, -3):
+        number = create_integer_from_int(value)
+        restored = pickle.loads(pickle.dumps(number))
+        assert type(restored) is type(number)
+        assert restored == number
+    # Keep large numbers out of the locals shown on failure
+    payload = pickle.dumps(create_integer_from_int(-1000))
+    assert int(pickle.loads(payload)) == -1000
+    assert len(payload) < 100
+
+
+@set_backend_only
+def test_pickle_pooled() -> None:
+    """Test unpickling returns pooled instances"""
+    one = create_integer_from_int(1)
+    assert pickle.loads(pickle.dumps(one)) is one
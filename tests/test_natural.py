@@ -1,8 +1,28 @@
 """Test code of Natural class"""
 
+import pickle
+
 import pytest
 
-from pynumber import Natural, create_natural_from_int
+from pynumber import Natural, create_natural_from_int, gcd, lcm
+from pynumber.backend import get_backend
+from pynumber.natural import (
+    clear_intern_table,
+    get_intern_capacity,
+    get_overflow_capacity,
+    get_tower_limit,
+    intern_table_size,
+    set_intern_capacity,
+    set_overflow_capacity,
+    set_tower_limit,
+    tower_height,
+    warm,
+)
+
+
+set_backend_only = pytest.mark.skipif(
+    get_backend() != "set", reason="specific to the set-theoretic backend"
+)
 
 
 def test_equality() -> None:
@@ -25,6 +45,19 @@ def test_inequality() -> None:
         _ = Natural() < ((),)
     with pytest.raises(TypeError):
         _ = Natural() <= ((),)
+    with pytest.raises(TypeError):
+        _ = Natural() > ((),)
+    with pytest.raises(TypeError):
+        _ = Natural() >= ((),)
+
+
+def test_sort() -> None:
+    """Test ordering of many ranks"""
+    naturals = [create_natural_from_int(n) for n in (5, 0, 900, 3, 3)]
+    assert [int(n) for n in sorted(naturals)] == [0, 3, 3, 5, 900]
+    assert max(naturals) == create_natural_from_int(900)
+    assert create_natural_from_int(3) < create_natural_from_int(900)
+    assert not create_natural_from_int(3) > create_natural_from_int(3)
 
 
 def test_successor() -> None:
@@ -70,6 +103,65 @@ def test_multiplication() -> None:
         _ = Natural() * ()
 
 
+@set_backend_only
+def test_large_arithmetic() -> None:
+    """Test arithmetic beyond the recursion limit"""
+    clear_intern_table()
+    a = create_natural_from_int(700)
+    b = create_natural_from_int(500)
+    assert int(a + b) == 1200
+    assert int(b + a) == 1200
+    assert tuple(a + b) == tuple(Natural(a[-1]).successor + b)
+    assert a + b is create_natural_from_int(1200)
+    assert int(create_natural_from_int(40) * create_natural_from_int(30)) == 1200
+    assert create_natural_from_int(30) * Natural() == Natural()
+    assert Natural() * create_natural_from_int(30) == Natural()
+
+
+def test_division() -> None:
+    """Test floor division and modulo"""
+    seven = create_natural_from_int(7)
+    three = create_natural_from_int(3)
+    assert seven // three == create_natural_from_int(2)
+    assert seven % three == Natural().successor
+    assert divmod(three, seven) == (Natural(), three)
+    with pytest.raises(ZeroDivisionError):
+        _ = seven // Natural()
+    with pytest.raises(TypeError):
+        _ = seven % 3
+
+
+def test_gcd() -> None:
+    """Test gcd and lcm"""
+    four = create_natural_from_int(4)
+    six = create_natural_from_int(6)
+    assert gcd(four, six) == create_natural_from_int(2)
+    assert gcd(Natural(), six) == six
+    assert lcm(four, six) == create_natural_from_int(12)
+    assert lcm(Natural(), six) == Natural()
+    with pytest.raises(TypeError):
+        _ = gcd(four, 6)  # type: ignore[arg-type]
+
+
+def test_power() -> None:
+    """Test power"""
+    two = create_natural_from_int(2)
+    three = create_natural_from_int(3)
+    assert three**two == create_natural_from_int(9)
+    assert two ** Natural() == Natural().successor
+    assert Natural() ** Natural() == Natural().successor
+    assert int(two ** create_natural_from_int(10)) == 1024
+    five = create_natural_from_int(5)
+    assert pow(three, five, create_natural_from_int(7)) == five
+    assert pow(three, Natural(), Natural().successor) == Natural()
+    with pytest.raises(TypeError):
+        _ = two**2
+    with pytest.raises(TypeError):
+        _ = pow(two, two, 3)
+    with pytest.raises(ValueError):
+        _ = pow(two, two, Natural())
+
+
 def test_unary_arithmetic_operation() -> None:
     """Test unary arithmetic operation"""
     one = Natural().successor
@@ -88,3 +180,118 @@ def test_create_from_int() -> None:
     assert create_natural_from_int(1) == Natural().successor
     with pytest.raises(ValueError):
         _ = create_natural_from_int(-1)
+
+
+@set_backend_only
+def test_interning() -> None:
+    """Test canonical instances are shared"""
+    three = create_natural_from_int(3)
+    assert three is Natural().successor.successor.successor
+    assert three is Natural(tuple(three))
+    assert three.predecessor is create_natural_from_int(2)
+    assert three[-1] is create_natural_from_int(4)[-2]
+
+
+@set_backend_only
+def test_interning_ignores_given_members() -> None:
+    """Test arbitrary members are never interned as canonical"""
+    limit = get_tower_limit()
+    try:
+        set_tower_limit(2)
+        clear_intern_table()
+        junk = Natural([("x",)] * 5)
+        assert len(junk) == 5
+        assert junk[0] == ()
+        assert create_natural_from_int(5) is junk
+        assert create_natural_from_int(4).successor[0] == ()
+        assert int(junk.predecessor) == 4
+    finally:
+        set_tower_limit(limit)
+
+
+@set_backend_only
+def test_intern_capacity() -> None:
+    """Test eviction of the intern table"""
+    capacity = get_intern_capacity()
+    try:
+        set_intern_capacity(2)
+        assert intern_table_size() <= 2
+        five = create_natural_from_int(5)
+        clear_intern_table()
+        assert intern_table_size() == 0
+        assert create_natural_from_int(5) is not five
+        assert create_natural_from_int(5) == five
+        with pytest.raises(ValueError):
+            set_intern_capacity(-1)
+    finally:
+        set_intern_capacity(capacity)
+
+
+@set_backend_only
+def test_tower() -> None:
+    """Test the tower cache behind create_natural_from_int"""
+    limit = get_tower_limit()
+    try:
+        warm(20)
+        assert tower_height() >= 20
+        clear_intern_table()
+        assert create_natural_from_int(20)[7] is create_natural_from_int(9)[7]
+        set_tower_limit(5)
+        assert tower_height() == 5
+        warm(8)
+        assert tower_height() == 5
+        eight = create_natural_from_int(8)
+        assert tuple(eight) == tuple(Natural(eight[-1]).successor)
+        assert eight.successor.predecessor == eight
+        with pytest.raises(ValueError):
+            warm(-1)
+        with pytest.raises(ValueError):
+            set_tower_limit(-1)
+    finally:
+        set_tower_limit(limit)
+
+
+@set_backend_only
+def test_overflow_cache() -> None:
+    """Test ranks above the tower limit are cached in LRU order"""
+    limit = get_tower_limit()
+    capacity = get_overflow_capacity()
+    try:
+        set_tower_limit(3)
+        set_overflow_capacity(2)
+        clear_intern_table()
+        nine = create_natural_from_int(9)
+        clear_intern_table()
+        assert create_natural_from_int(9)[-1] is nine[-1]
+        # Ten is built from the cached nine, so they share members
+        assert create_natural_from_int(10)[8] is nine[8]
+        create_natural_from_int(11)
+        clear_intern_table()
+        assert create_natural_from_int(9)[-1] is not nine[-1]
+        assert tower_height() == 3
+        set_overflow_capacity(0)
+        assert get_overflow_capacity() == 0
+        with pytest.raises(ValueError):
+            set_overflow_capacity(-1)
+    finally:
+        set_tower_limit(limit)
+        set_overflow_capacity(capacity)
+
+
+def test_hash() -> None:
+    """Test __hash__"""
+    three = create_natural_from_int(3)
+    assert hash(three) == hash(Natural(tuple(three)))
+    assert len({Natural(), Natural().successor, create_natural_from_int(1)}) == 2
+
+
+def test_pickle() -> None:
+    """Test pickling stores the rank only and restores a canonical instance"""
+    for number in (Natural(), create_natural_from_int(3)):
+        restored = pickle.loads(pickle.dumps(number))
+        assert type(restored) is type(number)
+        assert restored == number
+    # Keep large numbers out of the locals shown on failure
+    payload = pickle.dumps(create_natural_from_int(1000))
+    assert len(pickle.loads(payload)) == 1000
+    assert len(payload) < 100
@@ -0,0 +1,79 @@
+"""Test profiling"""
+
+import json
+import os
+import subprocess
+import sys
+
+from pynumber import (
+    Rational,
+    create_integer_from_int,
+    integer,
+    natural,
+    profile,
+    profiling,
+)
+
+
+def test_profile() -> None:
+    """Test counters of a profile"""
+    add = natural.Natural.__add__
+    a = natural.create_natural_from_int(3)
+    with profile() as stats:
+        assert profiling.is_enabled()
+        _ = a + a
+        _ = a + a
+    assert not profiling.is_enabled()
+    assert natural.Natural.__add__ is add
+    counters = stats.as_dict()
+    assert counters["natural.Natural"]["__add__"]["calls"] == 2
+    assert counters["natural.Natural"]["__add__"]["max_depth"] == 1
+    assert counters["natural.Natural"]["__add__"]["seconds"] > 0
+    assert json.loads(stats.to_json()) == counters
+
+    two = create_integer_from_int(2)
+    with profile() as stats:
+        _ = Rational(two, two + two)
+    counters = stats.as_dict()
+    assert counters["rational.Rational"]["__new__"]["allocations"] >= 1
+    assert counters["rational"]["_reduce"]["calls"] == 1
+
+
+def test_hooks_are_not_counted() -> None:
+    """Test allocation hooks do not record calls of their own"""
+    a, b = integer.create_integer_from_int(300), integer.create_integer_from_int(-2)
+    with profile() as stats:
+        _ = a + b
+    counters = stats.as_dict()
+    assert "__int__" not in counters["integer.Integer"]
+    # Integer.__new__ takes the value of its two parts once
+    assert counters["natural.Natural"]["__int__"]["calls"] == 2
+    assert counters["integer.Integer"]["__new__"]["allocations"] == 1
+
+
+def test_nested_profiles() -> None:
+    """Test every active profile records every operation"""
+    natural.clear_intern_table()
+    with profile() as outer:
+        _ = natural.create_natural_from_int(2)
+        with profile() as inner:
+            _ = natural.create_natural_from_int(5)
+        assert profiling.is_enabled()
+    assert inner.as_dict()["natural"]["create_natural_from_int"]["calls"] == 1
+    assert inner.as_dict()["natural"]["_intern"]["allocations"] == 1
+    assert outer.as_dict()["natural"]["create_natural_from_int"]["calls"] == 2
+
+
+def test_environment_variable(tmp_path: os.PathLike) -> None:
+    """Test PYNUMBER_PROFILE profiles the whole process"""
+    target = os.path.join(tmp_path, "profile.json")
+    root = os.path.dirname(os.path.dirname(__file__))
+    env = dict(os.environ, PYNUMBER_PROFILE=target)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.join(root, "src"), env.get("PYTHONPATH", "")]
+    )
+    code = "import pynumber; pynumber.natural.create_natural_from_int(4)"
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+    with open(target) as file:
+        counters = json.load(file)
+    assert counters["natural"]["create_natural_from_int"]["calls"] == 1
@@ -1,8 +1,16 @@
 """Test Integer class"""
 
+import pickle
+
 import pytest
 
-from pynumber import Integer, Rational, create_integer_from_int
+from pynumber import (
+    Integer,
+    Rational,
+    create_integer_from_int,
+    create_rational_from_ints,
+)
+from pynumber.rational import get_lazy_normalization, set_lazy_normalization
 
 
 def test_new() -> None:
@@ -102,3 +110,99 @@ def test_division() -> None:
         _ = zero / Integer()
     with pytest.raises(ZeroDivisionError):
         _ = zero / zero
+
+
+def test_hash() -> None:
+    """Test __hash__"""
+    one_over_two = Rational(create_integer_from_int(1), create_integer_from_int(2))
+    two_over_four = Rational(create_integer_from_int(-2), create_integer_from_int(-4))
+    minus_one_over_two = Rational(
+        create_integer_from_int(1), create_integer_from_int(-2)
+    )
+    assert hash(one_over_two) == hash(two_over_four)
+    assert len({one_over_two, two_over_four, minus_one_over_two}) == 2
+
+
+def test_power() -> None:
+    """Test power"""
+    minus_two_over_three = Rational(
+        create_integer_from_int(-2), create_integer_from_int(3)
+    )
+    assert minus_two_over_three ** create_integer_from_int(3) == Rational(
+        create_integer_from_int(-8), create_integer_from_int(27)
+    )
+    assert minus_two_over_three ** create_integer_from_int(-2) == Rational(
+        create_integer_from_int(9), create_integer_from_int(4)
+    )
+    assert minus_two_over_three ** Integer() == Rational(create_integer_from_int(1))
+    cube = minus_two_over_three ** create_integer_from_int(-3)
+    assert (int(cube.numerator), int(cube.denominator)) == (-27, 8)
+    with pytest.raises(ZeroDivisionError):
+        _ = Rational() ** create_integer_from_int(-1)
+    with pytest.raises(TypeError):
+        _ = minus_two_over_three**minus_two_over_three
+
+
+def test_lazy_normalization() -> None:
+    """Test lazy mode gives the same results as eager mode"""
+
+    def evaluate() -> Rational:
+        a = Rational(create_integer_from_int(1), create_integer_from_int(-2))
+        b = Rational(create_integer_from_int(2), create_integer_from_int(3))
+        c = Rational(create_integer_from_int(3), create_integer_from_int(4))
+        return a * b + c - a / c
+
+    threshold = get_lazy_normalization()
+    eager = evaluate()
+    try:
+        set_lazy_normalization(100)
+        two_over_four = Rational(create_integer_from_int(2), create_integer_from_int(4))
+        assert int(two_over_four.denominator) == 4
+        assert two_over_four.normalize() == Rational(
+            create_integer_from_int(1), create_integer_from_int(2)
+        )
+        assert int(two_over_four.normalize().denominator) == 2
+        lazy = evaluate()
+        assert lazy == eager
+        assert hash(lazy) == hash(eager)
+        assert repr(lazy) == repr(eager)
+        assert lazy.normalize() == eager
+        assert tuple(lazy.normalize()) == tuple(eager)
+        assert lazy > Rational() and Rational() < lazy
+        large = Rational(create_integer_from_int(202), create_integer_from_int(-4))
+        assert tuple(large) == tuple(
+            Rational(create_integer_from_int(-101), create_integer_from_int(2))
+        )
+        with pytest.raises(ZeroDivisionError):
+            _ = Rational(create_integer_from_int(1), Integer())
+        with pytest.raises(ValueError):
+            set_lazy_normalization(-1)
+    finally:
+        set_lazy_normalization(threshold)
+
+
+def test_create_from_ints() -> None:
+    """Test create_rational_from_ints"""
+    assert create_rational_from_ints(2, -4) == Rational(
+        create_integer_from_int(-1), create_integer_from_int(2)
+    )
+    assert create_rational_from_ints(3) == Rational(create_integer_from_int(3))
+    with pytest.raises(ZeroDivisionError):
+        create_rational_from_ints(1, 0)
+
+
+def test_pickle() -> None:
+    """Test pickling stores the reduced parts only"""
+    threshold = get_lazy_normalization()
+    try:
+        set_lazy_normalization(100)
+        lazy = create_rational_from_ints(6, -8)
+        restored = pickle.loads(pickle.dumps(lazy))
+        assert restored == lazy
+        assert tuple(restored) == tuple(create_rational_from_ints(-3, 4).normalize())
+    finally:
+        set_lazy_normalization(threshold)
+    # Keep large numbers out of the locals shown on failure
+    payload = pickle.dumps(create_rational_from_ints(-1000, 999))
+    assert tuple(map(int, pickle.loads(payload))) == (-1000, 999)
+    assert len(payload) < 150
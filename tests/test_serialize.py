@@ -0,0 +1,88 @@
+"""Test binary serialization"""
+
+import io
+from collections.abc import Iterator
+
+import pytest
+
+from pynumber import (
+    Rational,
+    create_integer_from_int,
+    create_natural_from_int,
+    create_rational_from_ints,
+)
+from pynumber.serialize import MAGIC, Number, dump_many, dumps, load_many, loads
+
+# Numbers are described by plain values, so that a failure never shows the
+# exponentially long repr of a large set-theoretic number
+VALUES = [
+    ("Natural", 0),
+    ("Natural", 300),
+    ("Integer", 0),
+    ("Integer", -64),
+    ("Integer", 1000),
+    ("Rational", (-3, 4)),
+    ("Rational", (0, 1)),
+]
+
+
+def _numbers() -> Iterator[Number]:
+    yield create_natural_from_int(0)
+    yield create_natural_from_int(300)
+    yield create_integer_from_int(0)
+    yield create_integer_from_int(-64)
+    yield create_integer_from_int(1000)
+    yield create_rational_from_ints(6, -8)
+    yield create_rational_from_ints(0, 5)
+
+
+def _describe(number: Number) -> tuple[str, object]:
+    if isinstance(number, Rational):
+        return "Rational", (int(number.numerator), int(number.denominator))
+    return type(number).__name__, int(number)
+
+
+def test_round_trip() -> None:
+    """Test dump_many and load_many"""
+    file = io.BytesIO()
+    assert dump_many(_numbers(), file) == len(VALUES)
+    file.seek(0)
+    assert [_describe(number) for number in load_many(file)] == VALUES
+    # Header, one tag byte per record and 11 varint bytes
+    assert len(file.getvalue()) == len(MAGIC) + 7 + 11
+
+
+def test_streaming() -> None:
+    """Test load_many reads lazily"""
+    file = io.BytesIO()
+    dump_many((create_integer_from_int(value) for value in range(-5, 5)), file)
+    file.seek(0)
+    numbers = load_many(file)
+    assert int(next(numbers)) == -5
+    assert file.tell() < len(file.getvalue())
+    assert [int(number) for number in numbers] == list(range(-4, 5))
+
+
+def test_dumps_loads() -> None:
+    """Test single numbers"""
+    half = create_rational_from_ints(1, 2)
+    assert loads(dumps(half)) == half
+    assert dumps(create_natural_from_int(3)) == MAGIC + b"N\x03"
+    assert dumps(create_integer_from_int(-1)) == MAGIC + b"I\x01"
+    # Keep large numbers out of the locals shown on failure
+    assert dumps(create_integer_from_int(64)) == MAGIC + b"I\x80\x01"
+    assert len(loads(MAGIC + b"N\x80\x01")) == 128
+
+
+def test_invalid() -> None:
+    """Test malformed input"""
+    with pytest.raises(TypeError):
+        dumps(1)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        loads(b"PYNUM\x02N\x00")
+    with pytest.raises(ValueError):
+        loads(MAGIC + b"N\x80")
+    with pytest.raises(ValueError):
+        loads(MAGIC + b"X\x00")
+    with pytest.raises(ValueError):
+        loads(MAGIC)